@@ -3,14 +3,20 @@
 정확도 최우선, 효율적인 데이터 처리 배치 시스템
 """
 
+import os
 import time
 import threading
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Callable
 from dataclasses import dataclass, field
-from queue import Queue, PriorityQueue
+from collections import deque
+from pathlib import Path
+from queue import Queue
 from enum import Enum
-import json
+import orjson
 
 from logging_system import UTF8LoggingSystem
 from mcp_interface import MCPInterface, MCPRequest, MCPResponse
@@ -45,10 +51,6 @@ class BatchTask:
     retry_count: int = 0
     max_retries: int = 3
 
-    def __lt__(self, other):
-        """우선순위 큐를 위한 비교 함수"""
-        return self.priority.value < other.priority.value
-
 @dataclass
 class BatchResult:
     """배치 처리 결과"""
@@ -60,37 +62,178 @@ class BatchResult:
     uncertain_items: List
     error_message: Optional[str] = None
 
+# 워커 프로세스 전용 MCP 인터페이스 (프로세스당 1회만 생성)
+_worker_mcp: Optional[MCPInterface] = None
+
+def _get_worker_mcp(mcp_config: Dict) -> MCPInterface:
+    """워커 프로세스에서 MCP 인터페이스 재구성 (설정 기반)"""
+    global _worker_mcp
+    if _worker_mcp is None:
+        worker_logger = UTF8LoggingSystem(mcp_config.get('log_base_path', './log'))
+        _worker_mcp = MCPInterface(worker_logger)
+    return _worker_mcp
+
+def _process_batch_task_standalone(task: BatchTask, mcp_config: Dict) -> BatchResult:
+    """
+    개별 배치 작업 처리 (워커 프로세스에서 실행)
+    GIL 우회를 위해 프로세스 단위로 실행되므로 모듈 레벨 함수로 유지
+    """
+    mcp = _get_worker_mcp(mcp_config)
+    start_time = time.time()
+
+    try:
+        # 작업 유형별 처리
+        if task.task_type == 'account_pattern_analysis':
+            mcp_response = mcp.analyze_account_patterns(
+                task.data, task.account_type
+            )
+        elif task.task_type == 'vat_verification':
+            mcp_response = mcp.verify_vat_status(task.data)
+        elif task.task_type == 'anomaly_detection':
+            mcp_response = mcp.detect_data_anomalies(
+                task.data.get('processed_data', {}),
+                task.data.get('original_data', {})
+            )
+        else:
+            raise ValueError(f"Unknown task type: {task.task_type}")
+
+        processing_time = time.time() - start_time
+
+        if mcp_response.success:
+            confidence = mcp_response.confidence_level
+            uncertain_items = mcp_response.uncertain_items
+        else:
+            confidence = 'UNCERTAIN'
+            uncertain_items = []
+
+        return BatchResult(
+            task_id=task.task_id,
+            success=mcp_response.success,
+            result_data=mcp_response.analysis_result,
+            processing_time=processing_time,
+            confidence_level=confidence,
+            uncertain_items=uncertain_items,
+            error_message=mcp_response.error_message
+        )
+
+    except Exception as e:
+        return BatchResult(
+            task_id=task.task_id,
+            success=False,
+            result_data={},
+            processing_time=time.time() - start_time,
+            confidence_level='UNCERTAIN',
+            uncertain_items=[],
+            error_message=str(e)
+        )
+
+def _process_bulk_tasks_standalone(tasks: List[BatchTask],
+                                   mcp_config: Dict) -> List[BatchResult]:
+    """
+    동일 유형 배치 작업 묶음 처리 (워커 프로세스에서 실행)
+    MCP 호출 1회로 여러 작업을 처리하여 호출 오버헤드 분산
+    """
+    mcp = _get_worker_mcp(mcp_config)
+    start_time = time.time()
+
+    try:
+        responses = mcp.analyze_account_patterns_bulk(
+            [task.data for task in tasks], tasks[0].account_type
+        )
+    except Exception as e:
+        processing_time = time.time() - start_time
+        return [
+            BatchResult(
+                task_id=task.task_id,
+                success=False,
+                result_data={},
+                processing_time=processing_time / len(tasks),
+                confidence_level='UNCERTAIN',
+                uncertain_items=[],
+                error_message=str(e)
+            )
+            for task in tasks
+        ]
+
+    results = []
+    for task, response in zip(tasks, responses):
+        if response.success:
+            confidence = response.confidence_level
+            uncertain_items = response.uncertain_items
+        else:
+            confidence = 'UNCERTAIN'
+            uncertain_items = []
+
+        results.append(BatchResult(
+            task_id=task.task_id,
+            success=response.success,
+            result_data=response.analysis_result,
+            processing_time=response.processing_time,
+            confidence_level=confidence,
+            uncertain_items=uncertain_items,
+            error_message=response.error_message
+        ))
+
+    return results
+
 class BatchProcessor:
     """
     배치 처리 시스템
     정확도 우선, 데이터 완결성 보장
     """
-    
-    def __init__(self, logging_system: UTF8LoggingSystem, mcp_interface: MCPInterface):
+
+    def __init__(self, logging_system: UTF8LoggingSystem, mcp_interface: MCPInterface,
+                 max_workers: Optional[int] = None):
         self.logger = logging_system
         self.mcp = mcp_interface
-        
-        # 배치 처리 큐
-        self.task_queue = PriorityQueue()
+
+        # 워커 프로세스에서 MCP 인터페이스 재구성용 설정
+        self.mcp_config = {
+            'log_base_path': str(getattr(logging_system, 'log_base_path', './log'))
+        }
+
+        # 배치 처리 큐: 우선순위별 FIFO (4단계뿐이므로 힙 정렬 불필요)
+        # 단일 조건 변수로 보호하여 잠금 경합 최소화
+        self.task_deques = {priority: deque() for priority in BatchPriority}
+        self.task_cond = threading.Condition()
+        self.unfinished_tasks = 0
         self.result_queue = Queue()
         self.failed_tasks = []
         self.uncertain_tasks = []
         
-        # 배치 처리 통계
+        # 배치 처리 통계 (갱신은 _stats_lock으로 보호)
         self.batch_stats = {
             'total_batches': 0,
             'completed_batches': 0,
             'failed_batches': 0,
             'uncertain_batches': 0,
             'retry_batches': 0,
-            'total_processing_time': 0,
-            'average_batch_time': 0
+            'total_processing_time': 0
         }
+        self._stats_lock = threading.Lock()
+        self._completed_total = 0  # 완료+불확실+실패 누적 (매번 재합산 방지)
         
-        # 워커 스레드 풀 (동시 처리용)
-        self.worker_threads = []
-        self.max_workers = 3  # 정확도 우선이므로 적은 수의 워커
+        # 워커 프로세스 풀 (GIL 우회, 동시 처리용)
+        # 기본값: 코어 수 - 1, 상한 16 (대형 서버에서의 과도한 경합 방지)
+        if max_workers is not None:
+            self.max_workers = max_workers
+        else:
+            self.max_workers = max(1, min(16, (os.cpu_count() or 4) - 1))
+        self.pool = ProcessPoolExecutor(max_workers=self.max_workers)
+        self.dispatcher_thread = None
         self.shutdown_flag = False
+
+        # 큐 용량 제한: 생산자가 처리 속도를 앞지르면 add_batch_task에서
+        # 블로킹되어 메모리 사용량이 일정 수준으로 유지됨 (역압)
+        self._queue_capacity = self.max_workers * 32
+        self._capacity_sem = threading.BoundedSemaphore(self._queue_capacity)
+
+        # 큐에서 한 번에 꺼내 묶음 처리할 최대 작업 수
+        # (소형 작업의 큐 잠금/MCP 호출 오버헤드 분산)
+        self.task_queue_batch_size = 8
+
+        # 작업 ID용 단조 증가 카운터 (datetime.now+strftime 호출 제거, 충돌 없음)
+        self._id_counter = itertools.count()
         
         # 배치 크기 최적화 설정 (PRD 기반)
         self.batch_optimization = {
@@ -110,7 +253,14 @@ class BatchProcessor:
                 'large_data': {'batch_size': 1, 'max_concurrent': 1}
             }
         }
-        
+
+        # 동시 처리 수가 워커 수를 넘지 않도록 보정
+        for account_config in self.batch_optimization.values():
+            for size_config in account_config.values():
+                size_config['max_concurrent'] = min(
+                    size_config['max_concurrent'], self.max_workers
+                )
+
         self.logger.log_validation_event(
             'INFO', 'SYSTEM', 'BATCH_PROCESSOR_INIT',
             '배치처리시스템초기화완료', {'max_workers': self.max_workers}
@@ -120,7 +270,7 @@ class BatchProcessor:
                       task_type: str, data: Dict, 
                       priority: BatchPriority = BatchPriority.NORMAL) -> str:
         """배치 작업 추가"""
-        task_id = f"{account_code}_{task_type}_{datetime.now().strftime('%H%M%S%f')}"
+        task_id = f"{account_code}_{task_type}_{next(self._id_counter):06d}"
         
         task = BatchTask(
             task_id=task_id,
@@ -131,184 +281,259 @@ class BatchProcessor:
             priority=priority
         )
         
-        self.task_queue.put(task)
+        self._enqueue_task(task)
         self.batch_stats['total_batches'] += 1
-        
-        self.logger.log_validation_event(
-            'INFO', account_code, 'BATCH_TASK_ADDED',
-            f'배치작업추가_{task_type}_{priority.name}',
-            {'task_id': task_id, 'data_size': len(data)}
-        )
-        
+
+        # 작업마다 호출되는 핫패스: 레벨 확인 후에만 메시지 포맷
+        if self.logger.enabled_for('INFO'):
+            self.logger.log_validation_event(
+                'INFO', account_code, 'BATCH_TASK_ADDED',
+                f'배치작업추가_{task_type}_{priority.name}',
+                {'task_id': task_id, 'data_size': len(data)}
+            )
+
         return task_id
-    
+
+    def _enqueue_task(self, task: BatchTask, consume_capacity: bool = True):
+        """우선순위 큐에 작업 추가 (용량 초과시 블로킹, 조건 변수 통지 포함)
+
+        consume_capacity=False는 내부 재시도 전용: 완료 처리 중인 작업의
+        용량 슬롯을 그대로 물려받는다. 완료 콜백 스레드가 여기서
+        세마포어 획득을 대기하면 슬롯을 반환할 주체가 자신뿐이라
+        큐 포화 상태에서 풀 전체가 교착된다.
+        """
+        if consume_capacity:
+            self._capacity_sem.acquire()
+        with self.task_cond:
+            self.task_deques[task.priority].append(task)
+            self.unfinished_tasks += 1
+            self.task_cond.notify()
+
+    def _pop_highest_priority_task(self) -> Optional[BatchTask]:
+        """CRITICAL→LOW 순서로 첫 비어있지 않은 큐에서 작업 추출 (잠금 보유 상태에서 호출)"""
+        for priority in BatchPriority:
+            dq = self.task_deques[priority]
+            if dq:
+                return dq.popleft()
+        return None
+
+    def _dequeue_task(self) -> Optional[BatchTask]:
+        """대기 중인 최고 우선순위 작업 가져오기 (종료 통지시 None)"""
+        with self.task_cond:
+            self.task_cond.wait_for(
+                lambda: any(self.task_deques.values()) or self.shutdown_flag
+            )
+            return self._pop_highest_priority_task()
+
+    def _pending_task_count(self) -> int:
+        """큐에 대기 중인 작업 수"""
+        with self.task_cond:
+            return sum(len(dq) for dq in self.task_deques.values())
+
+    def _mark_task_done(self, release_capacity: bool = True):
+        """작업 완료 처리: 용량 반환 및 완료 대기자 통지
+
+        release_capacity=False는 재시도가 이 작업의 슬롯을 물려받은 경우:
+        슬롯은 재시도 완료 시점에 반환된다.
+        """
+        with self.task_cond:
+            self.unfinished_tasks -= 1
+            if self.unfinished_tasks <= 0:
+                self.task_cond.notify_all()
+        if release_capacity:
+            self._capacity_sem.release()
+
     def start_batch_processing(self):
         """배치 처리 시작"""
         self.logger.log_validation_event(
             'INFO', 'SYSTEM', 'BATCH_PROCESSING_START',
-            f'배치처리시작_{self.max_workers}개워커'
+            f'배치처리시작_{self.max_workers}개워커프로세스'
         )
-        
-        # 워커 스레드 생성 및 시작
-        for i in range(self.max_workers):
-            worker = threading.Thread(
-                target=self._worker_thread,
-                name=f"BatchWorker-{i+1}",
-                daemon=True
-            )
-            worker.start()
-            self.worker_threads.append(worker)
-    
-    def _worker_thread(self):
-        """워커 스레드 함수"""
-        worker_name = threading.current_thread().name
-        
+
+        # 우선순위 순서 유지를 위해 단일 디스패처 스레드가
+        # PriorityQueue를 순서대로 비우며 프로세스 풀에 제출
+        self.dispatcher_thread = threading.Thread(
+            target=self._dispatch_tasks,
+            name="BatchDispatcher",
+            daemon=True
+        )
+        self.dispatcher_thread.start()
+
+    def _dispatch_tasks(self):
+        """디스패처 스레드: 우선순위 순서대로 작업을 워커 프로세스에 제출"""
         while not self.shutdown_flag:
             try:
-                # 작업 가져오기 (5초 타임아웃)
-                task = self.task_queue.get(timeout=5)
-                
-                self.logger.log_validation_event(
-                    'INFO', task.account_code, 'BATCH_PROCESSING_START',
-                    f'{worker_name}_작업시작_{task.task_type}',
-                    {'task_id': task.task_id}
-                )
-                
-                # 작업 처리
-                result = self._process_batch_task(task)
-                
-                # 결과 처리
-                self._handle_batch_result(task, result)
-                
-                self.task_queue.task_done()
-                
+                # 작업이 들어오거나 종료 통지가 올 때까지 블로킹 대기
+                # (타임아웃 폴링 없음, shutdown()의 notify_all로 깨어남)
+                task = self._dequeue_task()
+                if task is None:
+                    continue
+
+                drained = [task]
+
+                # 대기 중인 작업을 논블로킹으로 추가 수거 (묶음 처리)
+                with self.task_cond:
+                    while len(drained) < self.task_queue_batch_size:
+                        extra = self._pop_highest_priority_task()
+                        if extra is None:
+                            break
+                        drained.append(extra)
+
+                self._submit_drained_tasks(drained)
+
             except Exception as e:
                 if not self.shutdown_flag:  # 정상 종료가 아닌 경우만 로그
                     self.logger.log_validation_event(
-                        'ERROR', 'SYSTEM', 'WORKER_ERROR',
-                        f'{worker_name}_워커오류_{str(e)}'
+                        'ERROR', 'SYSTEM', 'DISPATCHER_ERROR',
+                        f'디스패처오류_{str(e)}'
                     )
                 continue
-    
-    def _process_batch_task(self, task: BatchTask) -> BatchResult:
-        """개별 배치 작업 처리"""
-        start_time = time.time()
-        task.status = BatchStatus.PROCESSING
-        
-        try:
-            # 작업 유형별 처리
+
+    def _submit_drained_tasks(self, drained: List[BatchTask]):
+        """수거된 작업들을 유형별로 묶어 워커 프로세스에 제출"""
+        # 동일 유형 패턴 분석 작업은 MCP 호출 1회로 묶음 처리
+        pattern_groups = {}
+        single_tasks = []
+
+        for task in drained:
+            task.status = BatchStatus.PROCESSING
             if task.task_type == 'account_pattern_analysis':
-                mcp_response = self.mcp.analyze_account_patterns(
-                    task.data, task.account_type
-                )
-            elif task.task_type == 'vat_verification':
-                mcp_response = self.mcp.verify_vat_status(task.data)
-            elif task.task_type == 'anomaly_detection':
-                mcp_response = self.mcp.detect_data_anomalies(
-                    task.data.get('processed_data', {}),
-                    task.data.get('original_data', {})
-                )
-            else:
-                raise ValueError(f"Unknown task type: {task.task_type}")
-            
-            processing_time = time.time() - start_time
-            
-            # 결과 분석 및 상태 결정
-            if mcp_response.success:
-                if mcp_response.confidence_level == 'UNCERTAIN':
-                    status = BatchStatus.UNCERTAIN
-                    self.uncertain_tasks.append(task)
-                else:
-                    status = BatchStatus.COMPLETED
-                    
-                task.status = status
-                confidence = mcp_response.confidence_level
-                uncertain_items = mcp_response.uncertain_items
-                
+                pattern_groups.setdefault(task.account_type, []).append(task)
             else:
-                task.status = BatchStatus.FAILED
-                confidence = 'UNCERTAIN'
-                uncertain_items = []
-                
-            result = BatchResult(
-                task_id=task.task_id,
-                success=mcp_response.success,
-                result_data=mcp_response.analysis_result,
-                processing_time=processing_time,
-                confidence_level=confidence,
-                uncertain_items=uncertain_items,
-                error_message=mcp_response.error_message
+                single_tasks.append(task)
+
+        for account_type, group in pattern_groups.items():
+            if len(group) == 1:
+                single_tasks.extend(group)
+                continue
+
+            self.logger.log_validation_event(
+                'INFO', 'SYSTEM', 'BATCH_BULK_SUBMIT',
+                f'일괄제출_{account_type}_{len(group)}건',
+                {'task_ids': [task.task_id for task in group]}
             )
-            
+
+            future = self.pool.submit(
+                _process_bulk_tasks_standalone, group, self.mcp_config
+            )
+            future.add_done_callback(partial(self._collect_bulk_results, group))
+
+        for task in single_tasks:
+            if self.logger.enabled_for('INFO'):
+                self.logger.log_validation_event(
+                    'INFO', task.account_code, 'BATCH_PROCESSING_START',
+                    f'작업제출_{task.task_type}',
+                    {'task_id': task.task_id}
+                )
+
+            future = self.pool.submit(
+                _process_batch_task_standalone, task, self.mcp_config
+            )
+            future.add_done_callback(partial(self._collect_task_result, task))
+
+    def _collect_task_result(self, task: BatchTask, future) -> None:
+        """워커 프로세스 완료 콜백: 결과 수집 및 상태 반영"""
+        try:
+            result = future.result()
+        except Exception as e:
+            result = self._build_error_result(task, str(e))
+
+        self._finalize_task(task, result)
+
+    def _collect_bulk_results(self, tasks: List[BatchTask], future) -> None:
+        """묶음 작업 완료 콜백: task_id별로 결과 분배"""
+        try:
+            results = future.result()
+        except Exception as e:
+            results = [self._build_error_result(task, str(e)) for task in tasks]
+
+        results_by_id = {result.task_id: result for result in results}
+
+        for task in tasks:
+            result = results_by_id.get(task.task_id)
+            if result is None:
+                result = self._build_error_result(task, '묶음결과누락')
+            self._finalize_task(task, result)
+
+    def _build_error_result(self, task: BatchTask, error_message: str) -> BatchResult:
+        """워커 프로세스 오류시 대체 결과 생성"""
+        return BatchResult(
+            task_id=task.task_id,
+            success=False,
+            result_data={},
+            processing_time=0.0,
+            confidence_level='UNCERTAIN',
+            uncertain_items=[],
+            error_message=error_message
+        )
+
+    def _finalize_task(self, task: BatchTask, result: BatchResult) -> None:
+        """작업 결과 반영: 상태 결정, 로깅, 결과 큐 등록"""
+        # 결과 분석 및 상태 결정
+        if result.success:
+            if result.confidence_level == 'UNCERTAIN':
+                task.status = BatchStatus.UNCERTAIN
+                self.uncertain_tasks.append(task)
+            else:
+                task.status = BatchStatus.COMPLETED
+        else:
+            task.status = BatchStatus.FAILED
+
+        log_level = 'INFO' if result.success else 'WARNING'
+        if self.logger.enabled_for(log_level):
             self.logger.log_validation_event(
-                'INFO' if mcp_response.success else 'WARNING',
+                log_level,
                 task.account_code,
                 'BATCH_TASK_COMPLETED',
-                f'작업완료_{task.task_type}_{status.value}_{confidence}',
+                f'작업완료_{task.task_type}_{task.status.value}_{result.confidence_level}',
                 {
                     'task_id': task.task_id,
-                    'processing_time': processing_time,
-                    'uncertain_items': len(uncertain_items)
+                    'processing_time': result.processing_time,
+                    'uncertain_items': len(result.uncertain_items)
                 }
             )
-            
-            return result
-            
-        except Exception as e:
-            processing_time = time.time() - start_time
-            task.status = BatchStatus.FAILED
-            
-            error_result = BatchResult(
-                task_id=task.task_id,
-                success=False,
-                result_data={},
-                processing_time=processing_time,
-                confidence_level='UNCERTAIN',
-                uncertain_items=[],
-                error_message=str(e)
-            )
-            
-            self.logger.log_validation_event(
-                'ERROR', task.account_code, 'BATCH_TASK_ERROR',
-                f'작업오류_{task.task_type}_{str(e)}',
-                {'task_id': task.task_id, 'processing_time': processing_time}
-            )
-            
-            return error_result
-    
-    def _handle_batch_result(self, task: BatchTask, result: BatchResult):
-        """배치 결과 처리"""
+
+        slot_transferred = self._handle_batch_result(task, result)
+
+        self._mark_task_done(release_capacity=not slot_transferred)
+
+    def _handle_batch_result(self, task: BatchTask, result: BatchResult) -> bool:
+        """배치 결과 처리 (재시도가 용량 슬롯을 물려받았으면 True 반환)"""
         task.result = result.result_data
         task.processing_time = result.processing_time
-        
+
         # 통계 업데이트
         self._update_batch_stats(task, result)
-        
+
         # 결과 큐에 추가
         self.result_queue.put(result)
-        
+
         # 실패한 작업 재시도 처리
+        slot_transferred = False
         if not result.success and task.retry_count < task.max_retries:
             self._retry_failed_task(task)
+            slot_transferred = True
         elif not result.success:
             self.failed_tasks.append(task)
-            
+
         # UNCERTAIN 작업 특별 처리
         if result.confidence_level == 'UNCERTAIN':
             self._handle_uncertain_task(task, result)
-    
+
+        return slot_transferred
+
     def _retry_failed_task(self, task: BatchTask):
-        """실패한 작업 재시도"""
+        """실패한 작업 재시도 (완료 처리 중인 원 작업의 용량 슬롯을 물려받아 재등록)"""
         task.retry_count += 1
         task.status = BatchStatus.PENDING
-        
+
         # 우선순위를 높여서 재시도
         if task.priority == BatchPriority.NORMAL:
             task.priority = BatchPriority.HIGH
         elif task.priority == BatchPriority.HIGH:
             task.priority = BatchPriority.CRITICAL
-        
-        self.task_queue.put(task)
+
+        self._enqueue_task(task, consume_capacity=False)
         self.batch_stats['retry_batches'] += 1
         
         self.logger.log_validation_event(
@@ -335,27 +560,26 @@ class BatchProcessor:
         pass
     
     def _update_batch_stats(self, task: BatchTask, result: BatchResult):
-        """배치 통계 업데이트"""
-        self.batch_stats['total_processing_time'] += result.processing_time
-        
-        if result.success:
-            if result.confidence_level == 'UNCERTAIN':
-                self.batch_stats['uncertain_batches'] += 1
+        """배치 통계 업데이트 (콜백 스레드 경합 대비 잠금 보호)"""
+        with self._stats_lock:
+            self.batch_stats['total_processing_time'] += result.processing_time
+
+            if result.success:
+                if result.confidence_level == 'UNCERTAIN':
+                    self.batch_stats['uncertain_batches'] += 1
+                else:
+                    self.batch_stats['completed_batches'] += 1
             else:
-                self.batch_stats['completed_batches'] += 1
-        else:
-            self.batch_stats['failed_batches'] += 1
-        
-        # 평균 처리 시간 계산
-        completed_total = (self.batch_stats['completed_batches'] + 
-                          self.batch_stats['uncertain_batches'] +
-                          self.batch_stats['failed_batches'])
-        
-        if completed_total > 0:
-            self.batch_stats['average_batch_time'] = (
-                self.batch_stats['total_processing_time'] / completed_total
-            )
-    
+                self.batch_stats['failed_batches'] += 1
+
+            self._completed_total += 1
+
+    @property
+    def average_batch_time(self) -> float:
+        """평균 처리 시간 (조회 시점에 계산, 작업마다 재계산 안함)"""
+        return (self.batch_stats['total_processing_time'] /
+                max(self._completed_total, 1))
+
     def optimize_batch_size(self, account_type: str, data_size: int) -> Dict:
         """데이터 크기에 따른 배치 크기 최적화"""
         if account_type not in self.batch_optimization:
@@ -386,13 +610,15 @@ class BatchProcessor:
         
         batch_size = optimization['batch_size']
         task_ids = []
-        
-        # 월별 데이터를 배치 크기에 맞게 분할
-        items = list(monthly_data.items())
-        
-        for i in range(0, len(items), batch_size):
-            batch_data = dict(items[i:i + batch_size])
-            
+
+        # 월별 데이터를 배치 크기 단위로 스트리밍 분할 (전체 리스트 복사 없음)
+        items_iter = iter(monthly_data.items())
+
+        while True:
+            batch_data = dict(itertools.islice(items_iter, batch_size))
+            if not batch_data:
+                break
+
             # 중요한 데이터일수록 높은 우선순위
             if account_type == 'VAT' or len(batch_data) > optimization['batch_size'] * 0.8:
                 priority = BatchPriority.HIGH
@@ -414,16 +640,15 @@ class BatchProcessor:
         return task_ids
     
     def wait_for_batch_completion(self, timeout_seconds: int = 300) -> Dict:
-        """배치 작업 완료 대기"""
+        """배치 작업 완료 대기 (조건 변수 기반, 폴링 없음)"""
         start_time = time.time()
-        
-        while (self.task_queue.qsize() > 0 and 
-               (time.time() - start_time) < timeout_seconds):
-            time.sleep(1)
-        
-        # 모든 작업 완료 확인
-        self.task_queue.join()
-        
+
+        with self.task_cond:
+            self.task_cond.wait_for(
+                lambda: self.unfinished_tasks == 0,
+                timeout=timeout_seconds
+            )
+
         completion_time = time.time() - start_time
         
         # 완료 상태 로깅
@@ -445,12 +670,15 @@ class BatchProcessor:
         return completion_stats
     
     def get_all_results(self) -> List[BatchResult]:
-        """모든 배치 결과 수집"""
-        results = []
-        
-        while not self.result_queue.empty():
-            results.append(self.result_queue.get())
-        
+        """모든 배치 결과 수집 (잠금 1회로 일괄 회수)"""
+        # empty()+get() 반복은 호출마다 잠금을 잡고 경쟁 조건도 있음
+        # 내부 deque를 잠금 한 번으로 통째로 비워서 회수
+        with self.result_queue.mutex:
+            results = list(self.result_queue.queue)
+            self.result_queue.queue.clear()
+            self.result_queue.unfinished_tasks = 0
+            self.result_queue.all_tasks_done.notify_all()
+
         return results
     
     def get_uncertain_tasks(self) -> List[BatchTask]:
@@ -467,7 +695,7 @@ class BatchProcessor:
             'timestamp': datetime.now().isoformat(),
             'batch_statistics': self.batch_stats,
             'queue_status': {
-                'pending_tasks': self.task_queue.qsize(),
+                'pending_tasks': self._pending_task_count(),
                 'pending_results': self.result_queue.qsize()
             },
             'task_analysis': {
@@ -477,18 +705,19 @@ class BatchProcessor:
                 'uncertainty_rate': self._calculate_uncertainty_rate()
             },
             'performance_metrics': {
-                'average_processing_time': self.batch_stats['average_batch_time'],
+                'average_processing_time': self.average_batch_time,
                 'total_processing_time': self.batch_stats['total_processing_time'],
                 'throughput_per_minute': self._calculate_throughput()
             }
         }
         
-        # 보고서 파일 저장 (UTF-8 보장)
+        # 보고서 파일 저장 (orjson: UTF-8 네이티브, 한글 이스케이프 없음)
         report_file = f"./log/batch_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         try:
-            with open(report_file, 'w', encoding='utf-8') as f:
-                json.dump(report, f, ensure_ascii=False, indent=2)
-            
+            Path(report_file).write_bytes(
+                orjson.dumps(report, option=orjson.OPT_INDENT_2, default=str)
+            )
+
             report['report_file'] = report_file
         except Exception as e:
             self.logger.log_validation_event(
@@ -500,51 +729,45 @@ class BatchProcessor:
     
     def _calculate_success_rate(self) -> float:
         """성공률 계산"""
-        total = (self.batch_stats['completed_batches'] + 
-                self.batch_stats['failed_batches'] + 
-                self.batch_stats['uncertain_batches'])
-        
-        if total == 0:
+        if self._completed_total == 0:
             return 0.0
-            
-        return (self.batch_stats['completed_batches'] / total) * 100
-    
+
+        return (self.batch_stats['completed_batches'] / self._completed_total) * 100
+
     def _calculate_uncertainty_rate(self) -> float:
         """불확실률 계산"""
-        total = (self.batch_stats['completed_batches'] + 
-                self.batch_stats['failed_batches'] + 
-                self.batch_stats['uncertain_batches'])
-        
-        if total == 0:
+        if self._completed_total == 0:
             return 0.0
-            
-        return (self.batch_stats['uncertain_batches'] / total) * 100
-    
+
+        return (self.batch_stats['uncertain_batches'] / self._completed_total) * 100
+
     def _calculate_throughput(self) -> float:
         """처리량 계산 (작업/분)"""
         total_time_minutes = self.batch_stats['total_processing_time'] / 60
-        total_completed = (self.batch_stats['completed_batches'] + 
-                          self.batch_stats['uncertain_batches'] + 
-                          self.batch_stats['failed_batches'])
-        
+
         if total_time_minutes == 0:
             return 0.0
-            
-        return total_completed / total_time_minutes
+
+        return self._completed_total / total_time_minutes
     
     def shutdown(self):
         """배치 처리 시스템 종료"""
         self.shutdown_flag = True
-        
+
+        # 대기 중인 디스패처 즉시 깨우기
+        with self.task_cond:
+            self.task_cond.notify_all()
+
         self.logger.log_validation_event(
             'INFO', 'SYSTEM', 'BATCH_SYSTEM_SHUTDOWN',
             '배치처리시스템종료시작'
         )
         
-        # 모든 워커 스레드 대기
-        for worker in self.worker_threads:
-            worker.join(timeout=10)
-        
+        # 디스패처 스레드 및 워커 프로세스 풀 종료 대기
+        if self.dispatcher_thread is not None:
+            self.dispatcher_thread.join(timeout=10)
+        self.pool.shutdown(wait=True)
+
         # 최종 보고서 생성
         final_report = self.generate_batch_report()
         
@@ -3,14 +3,43 @@
 CLAUDE.md 규칙 완전 준수, PRD 기반 통합 시스템
 """
 
+import copy
+import io
+import shutil
+import logging
 import os
+import re
+import bisect
 import sys
 import time
 import json
+import orjson
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 from openpyxl import load_workbook
+from openpyxl.styles import PatternFill
+
+# 선택적 고속 백엔드: python-calamine(Rust 파서)이 설치된 환경에서만 사용
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+
+# 데이터 이슈 마킹용 공유 노란색 채우기 (CLAUDE.md #FFFF00, 호출마다 재생성 금지)
+_YELLOW_FILL = PatternFill(start_color='FFFF00', end_color='FFFF00', fill_type='solid')
+
+# 월계 행 B열 라벨 판정: '월'과 '계'가 독립 토큰으로 연속할 때만 일치
+# 실제 원장 셀은 '  [ 월         계 ]' 형태 — 공백 변형과 괄호는 흡수하되
+# '이월 계정', '3월 계약금' 같은 일반 적요의 부분 문자열 매칭은 차단
+_MONTH_SUMMARY_RE = re.compile(r'(?:^|\s)월\s+계(?:\s|$)')
+
+# 수치형 판정용 공유 타입 튜플
+_NUMTYPES = (int, float)
 
 # 프로젝트 모듈들
 from logging_system import UTF8LoggingSystem
@@ -19,12 +48,126 @@ from marking_system import YellowMarkingSystem
 from mcp_interface import MCPInterface
 from batch_processor import BatchProcessor, BatchPriority
 
+
+@lru_cache(maxsize=8)
+def _read_config_json(config_path: str, mtime: float) -> Dict:
+    """설정 JSON 파싱 결과 캐시 (파일 mtime 변경 시 자동 무효화)"""
+    with open(config_path, 'rb') as f:
+        return orjson.loads(f.read())
+
+
+def _compute_quality_score(marked_cells: int, uncertain_items: int,
+                           contamination_detected: bool) -> int:
+    """
+    품질 점수 계산 (100점 만점, 순수 산술 함수)
+    스칼라 연산만 수행하므로 계정 단위 일괄 점수화로 확장 가능
+    """
+    base_score = 100
+
+    # 마킹된 셀에 따른 감점 (최대 30점)
+    if marked_cells > 0:
+        base_score -= min(marked_cells * 2, 30)
+
+    # UNCERTAIN 항목에 따른 감점 (최대 25점)
+    if uncertain_items > 0:
+        base_score -= min(uncertain_items * 5, 25)
+
+    # 교차 오염 감지시 대폭 감점
+    if contamination_detected:
+        base_score -= 40
+
+    return max(base_score, 0)
+
+
+# 계정코드 분류 구간 (시작값 기준 정렬, 서로 겹치지 않음)
+# CLAUDE.md 계정 분류 기준과 동일 — LedgerExtractionEngine의 범위 설정 참조
+_CLASS_INTERVALS = sorted([
+    (10000, 25000, 'BS'),   # 자산
+    (25000, 30000, 'BS'),   # 부채
+    (33000, 38000, 'BS'),   # 자본
+    (40000, 42100, 'PL'),   # 수익
+    (45000, 46100, 'PL'),   # 비용
+    (52000, 53100, 'PL'),   # 비용
+    (80000, 84100, 'PL'),   # 비용
+    (90000, 92100, 'PL'),   # 수익
+    (93000, 96100, 'PL'),   # 비용
+])
+_CLASS_STARTS = [start for start, _end, _label in _CLASS_INTERVALS]
+
+
+@lru_cache(maxsize=None)
+def _classify_account_code(code_int: int) -> str:
+    """
+    계정코드 BS/PL 분류 (순수 함수, 결과 무한 캐시)
+    정렬된 구간 목록에서 bisect로 후보 구간을 O(log n)에 탐색
+    """
+    i = bisect.bisect_right(_CLASS_STARTS, code_int) - 1
+    if i >= 0 and code_int < _CLASS_INTERVALS[i][1]:
+        return _CLASS_INTERVALS[i][2]
+
+    # VAT 계정 특별 처리 (분류 구간 밖일 때만 도달 — 기존 확인 순서 유지)
+    if code_int in (13500, 25500):
+        return 'VAT'
+
+    return 'UNKNOWN'
+
+
+def _extract_one_ledger_sheet(task: Tuple[str, str]) -> Tuple[Optional[str], Optional[Dict]]:
+    """
+    워커 프로세스용 원장 시트 추출 함수 (피클 가능하도록 모듈 수준 정의)
+    프로세스마다 파일을 read_only로 열어 시트 하나만 처리하고 평범한 dict를 반환
+    """
+    path, sheet_name = task
+    engine = LedgerExtractionEngine()
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        return engine._extract_single_sheet(workbook, sheet_name)
+    except Exception as e:
+        logging.error("[추출실패] [시트_%s] [오류_%s]", sheet_name, e)
+        return None, None
+    finally:
+        workbook.close()
+
+
+# 워커 프로세스 전용 검증기 (프로세스당 1회만 생성)
+# DataValidator 초기화는 초 단위 타임스탬프 로그 파일을 'w' 모드로 열고
+# 루트 로깅을 재구성하므로, 시트마다 새로 만들면 같은 초에 검증된
+# 이전 시트의 감사 기록이 덮어써진다
+_worker_validator: Optional[DataValidator] = None
+
+
+def _get_worker_validator() -> DataValidator:
+    """워커 프로세스에서 DataValidator 재사용 (batch_processor._get_worker_mcp와 동일 패턴)"""
+    global _worker_validator
+    if _worker_validator is None:
+        _worker_validator = DataValidator()
+    return _worker_validator
+
+
+def _validate_sheet_rows_standalone(sheet_name: str, rows: List[tuple]) -> Tuple[Dict, List[Dict]]:
+    """
+    워커 프로세스용 시트 검증 함수 (피클 가능하도록 모듈 수준 정의)
+    프로세스 공용 DataValidator로 값 기반 검증 수행 후 결과와
+    이번 시트에서 새로 발생한 마킹 기록만 반환
+    """
+    validator = _get_worker_validator()
+    marks_before = len(validator.yellow_marks)
+    result = validator.validate_account_rows(sheet_name, rows)
+    return result, validator.yellow_marks[marks_before:]
+
+
 class MainProcessor:
     """
     재무데이터 처리 메인 프로세서
     3단계 검증 체계: Python 기본검증 -> MCP 패턴분석 -> Python 최종검증
     """
-    
+
+    # 시트명에서 계정코드 후보 추출 (시트 인덱스 구축용)
+    _SHEET_CODE_RE = re.compile(r'\d{3,6}')
+
+    # 분석/요약 시트 제외 필터 (키워드별 부분문자열 검색 대신 단일 패턴)
+    _SKIP_SHEET_RE = re.compile(r'(?i)분석|summary|temp|요약')
+
     def __init__(self, config_path: Optional[str] = None):
         # 시스템 초기화
         self.session_id = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -61,6 +204,13 @@ class MainProcessor:
         self.validation_results = {}
         self.batch_results = {}
         self.contamination_alerts = []
+
+        # 워크북 핸들 (스캔용 read_only / 마킹·저장용 전체 로드 분리)
+        self._source_file_path = None
+        self._edit_workbook = None
+
+        # 계정코드 -> 시트명 인덱스 (파일 처리 시작 시 1회 구축)
+        self._sheet_index: Dict[str, str] = {}
         
         self.logger.log_validation_event(
             'INFO', 'SYSTEM', 'MAIN_PROCESSOR_INIT',
@@ -90,9 +240,10 @@ class MainProcessor:
         
         if config_path and os.path.exists(config_path):
             try:
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    user_config = json.load(f)
-                    default_config.update(user_config)
+                user_config = _read_config_json(config_path, os.path.getmtime(config_path))
+                # 깊은 복사로 전달: 얕은 복사는 중첩 dict(validation 등)를
+                # 캐시와 공유하므로 호출측의 제자리 수정이 캐시를 오염시킨다
+                default_config.update(copy.deepcopy(user_config))
             except Exception as e:
                 print(f"설정 파일 로드 실패, 기본 설정 사용: {e}")
         
@@ -123,23 +274,36 @@ class MainProcessor:
                 {'input_file': file_path, 'output_file': output_path}
             )
             
-            # 워크북 로드
-            workbook = load_workbook(file_path)
-            
-            # Phase 1: Python 기본 검증
-            phase1_result = self._execute_phase1_python_basic_validation(workbook)
-            
-            # Phase 2: MCP 패턴 분석 (배치 처리)
-            phase2_result = self._execute_phase2_mcp_analysis(workbook, phase1_result)
-            
-            # Phase 3: Python 최종 검증
-            phase3_result = self._execute_phase3_python_final_validation(
-                workbook, phase1_result, phase2_result
-            )
-            
-            # 결과 통합 및 파일 저장
+            # 스캔용 워크북: 값 추출 전용이므로 read_only 스트리밍 로드
+            # (전체 DOM 로드는 마킹/저장이 필요한 시점에만 지연 수행)
+            self._source_file_path = file_path
+            self._edit_workbook = None
+            scan_workbook = load_workbook(file_path, read_only=True, data_only=True)
+
+            # 계정코드 -> 시트명 인덱스 구축 (이후 시트 탐색은 O(1) 조회)
+            self._sheet_index = {
+                code: sheet_name
+                for sheet_name in scan_workbook.sheetnames
+                for code in self._SHEET_CODE_RE.findall(sheet_name)
+            }
+
+            try:
+                # Phase 1: Python 기본 검증
+                phase1_result = self._execute_phase1_python_basic_validation(scan_workbook)
+
+                # Phase 2: MCP 패턴 분석 (배치 처리)
+                phase2_result = self._execute_phase2_mcp_analysis(scan_workbook, phase1_result)
+
+                # Phase 3: Python 최종 검증
+                phase3_result = self._execute_phase3_python_final_validation(
+                    scan_workbook, phase1_result, phase2_result
+                )
+            finally:
+                scan_workbook.close()
+
+            # 결과 통합 및 파일 저장 (셀 기록이 가능한 전체 로드 워크북 사용)
             final_result = self._finalize_processing(
-                workbook, output_path, phase1_result, phase2_result, phase3_result
+                self._get_edit_workbook(), output_path, phase1_result, phase2_result, phase3_result
             )
             
             # 세션 종료 및 정리
@@ -162,7 +326,7 @@ class MainProcessor:
         - 필수 필드 존재 확인
         - 기본적인 데이터 타입 검증
         """
-        phase_start = time.time()
+        phase_start = time.monotonic_ns()
         self.processing_stats['processing_phases']['phase1_python_basic']['status'] = 'PROCESSING'
         
         self.logger.log_validation_event(
@@ -178,47 +342,61 @@ class MainProcessor:
         
         try:
             # 모든 시트 스캔 (분석 시트 제외)
-            valid_sheets = [sheet for sheet in workbook.sheetnames 
-                           if not any(keyword in sheet.lower() 
-                                    for keyword in ['분석', 'summary', 'temp', '요약'])]
+            valid_sheets = [sheet for sheet in workbook.sheetnames
+                           if not self._SKIP_SHEET_RE.search(sheet)]
             
             self.processing_stats['total_accounts'] = len(valid_sheets)
-            
-            for sheet_name in valid_sheets:
-                try:
-                    # 계정별 검증 수행
-                    validation_result = self.validator.validate_account_data(workbook, sheet_name)
-                    
-                    if validation_result['validation_passed']:
-                        phase1_results['validated_accounts'][sheet_name] = validation_result
-                        self.processing_stats['processed_accounts'] += 1
-                    else:
+
+            # 시트 값 일괄 추출 (워커 프로세스 전달용 - 워크북 객체는 피클 불가)
+            sheet_rows = {
+                sheet_name: list(workbook[sheet_name].iter_rows(values_only=True))
+                for sheet_name in valid_sheets
+            }
+
+            # 시트별 검증을 워커 프로세스에 분산 (CPU 바운드 순수 값 연산)
+            max_workers = max(1, min(len(valid_sheets), os.cpu_count() or 4))
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                future_to_sheet = {
+                    executor.submit(_validate_sheet_rows_standalone, sheet_name, rows): sheet_name
+                    for sheet_name, rows in sheet_rows.items()
+                }
+
+                for future in as_completed(future_to_sheet):
+                    sheet_name = future_to_sheet[future]
+                    try:
+                        validation_result, worker_marks = future.result()
+                        self.validator.yellow_marks.extend(worker_marks)
+
+                        if validation_result['validation_passed']:
+                            phase1_results['validated_accounts'][sheet_name] = validation_result
+                            self.processing_stats['processed_accounts'] += 1
+                        else:
+                            phase1_results['invalid_sheets'].append({
+                                'sheet_name': sheet_name,
+                                'issues': validation_result['issues'],
+                                'account_code': validation_result.get('account_code')
+                            })
+                            self.processing_stats['failed_accounts'] += 1
+
+                            # 실패한 시트 전체를 노란색 마킹
+                            self._mark_invalid_sheet(workbook, sheet_name, validation_result)
+
+                    except Exception as e:
+                        self.logger.log_validation_event(
+                            'ERROR', 'UNKNOWN', 'VALIDATION_ERROR',
+                            f'시트검증오류_{sheet_name}_{str(e)}'
+                        )
                         phase1_results['invalid_sheets'].append({
                             'sheet_name': sheet_name,
-                            'issues': validation_result['issues'],
-                            'account_code': validation_result.get('account_code')
+                            'error': str(e)
                         })
-                        self.processing_stats['failed_accounts'] += 1
-                        
-                        # 실패한 시트 전체를 노란색 마킹
-                        self._mark_invalid_sheet(workbook, sheet_name, validation_result)
-                
-                except Exception as e:
-                    self.logger.log_validation_event(
-                        'ERROR', 'UNKNOWN', 'VALIDATION_ERROR',
-                        f'시트검증오류_{sheet_name}_{str(e)}'
-                    )
-                    phase1_results['invalid_sheets'].append({
-                        'sheet_name': sheet_name,
-                        'error': str(e)
-                    })
             
             # 마킹된 셀 정보 수집
             phase1_results['marked_cells'] = self.validator.yellow_marks
             self.processing_stats['marked_cells'] = len(self.validator.yellow_marks)
             
             # Phase 1 완료
-            phase_duration = time.time() - phase_start
+            phase_duration = (time.monotonic_ns() - phase_start) / 1e9
             self.processing_stats['processing_phases']['phase1_python_basic'].update({
                 'status': 'COMPLETED',
                 'duration': phase_duration
@@ -243,7 +421,7 @@ class MainProcessor:
         - VAT 포함/제외 판단
         - 이상 케이스 분석
         """
-        phase_start = time.time()
+        phase_start = time.monotonic_ns()
         self.processing_stats['processing_phases']['phase2_mcp_analysis']['status'] = 'PROCESSING'
         
         self.logger.log_validation_event(
@@ -258,25 +436,42 @@ class MainProcessor:
         }
         
         try:
+            # MCP 분석 대상 계정 선별 (UNKNOWN 계정 제외)
+            eligible_accounts = [
+                validation_data
+                for validation_data in phase1_result['validated_accounts'].values()
+                if validation_data['account_code'] and validation_data['account_type'] != 'UNKNOWN'
+            ]
+
+            # 대상 계정이 없으면 배치 기동/대기 없이 즉시 종료
+            if not eligible_accounts:
+                self.processing_stats['processing_phases']['phase2_mcp_analysis'].update({
+                    'status': 'COMPLETED',
+                    'duration': 0
+                })
+                self.logger.log_validation_event(
+                    'INFO', 'SYSTEM', 'PHASE2_SKIPPED',
+                    'MCP분석대상계정없음_배치처리생략'
+                )
+                return phase2_results
+
             # 배치 처리 시작
             self.batch_processor.start_batch_processing()
-            
+
             # 검증된 계정들에 대해 MCP 분석 수행
-            for sheet_name, validation_data in phase1_result['validated_accounts'].items():
+            # (계정별 ID 목록을 모아 마지막에 정확한 크기로 1회 평탄화)
+            task_id_batches = []
+            for validation_data in eligible_accounts:
                 account_code = validation_data['account_code']
                 account_type = validation_data['account_type']
                 monthly_data = validation_data['monthly_data']
-                
-                if not account_code or account_type == 'UNKNOWN':
-                    # UNKNOWN 계정은 MCP 분석에서 제외
-                    continue
-                
+
                 # 최적화된 배치 생성 및 작업 추가
-                task_ids = self.batch_processor.create_optimized_batches(
+                task_id_batches.append(self.batch_processor.create_optimized_batches(
                     account_code, account_type, monthly_data, 'account_pattern_analysis'
-                )
-                
-                phase2_results['batch_results'].extend(task_ids)
+                ))
+
+            phase2_results['batch_results'] = list(chain.from_iterable(task_id_batches))
             
             # 모든 배치 작업 완료 대기
             completion_stats = self.batch_processor.wait_for_batch_completion(
@@ -302,7 +497,7 @@ class MainProcessor:
             self._process_uncertain_items(workbook, phase2_results['uncertain_items'])
             
             # Phase 2 완료
-            phase_duration = time.time() - phase_start
+            phase_duration = (time.monotonic_ns() - phase_start) / 1e9
             self.processing_stats['processing_phases']['phase2_mcp_analysis'].update({
                 'status': 'COMPLETED',
                 'duration': phase_duration
@@ -329,7 +524,7 @@ class MainProcessor:
         - 데이터 무결성 확인
         - 최종 품질 보증
         """
-        phase_start = time.time()
+        phase_start = time.monotonic_ns()
         self.processing_stats['processing_phases']['phase3_python_final']['status'] = 'PROCESSING'
         
         self.logger.log_validation_event(
@@ -344,13 +539,20 @@ class MainProcessor:
         }
         
         try:
-            # 교차 오염 검사
+            # 교차 오염 검사 (설정으로 비활성화 시 전체 원장 재추출 생략)
             processed_data = self._consolidate_processed_data(phase1_result, phase2_result)
-            original_ledger_data = self._extract_original_ledger_data(workbook)
-            
-            contamination_alerts = self.validator.detect_cross_contamination(
-                processed_data, original_ledger_data
-            )
+
+            if self.config['validation']['cross_contamination_check']:
+                original_ledger_data = self._extract_original_ledger_data(workbook)
+                contamination_alerts = self.validator.detect_cross_contamination(
+                    processed_data, original_ledger_data
+                )
+            else:
+                contamination_alerts = []
+                self.logger.log_validation_event(
+                    'INFO', 'SYSTEM', 'CONTAMINATION_CHECK_SKIPPED',
+                    '교차오염검사_설정비활성화_원장재추출생략'
+                )
             
             if contamination_alerts:
                 # 교차 오염 발견시 즉시 중단 및 마킹
@@ -386,7 +588,7 @@ class MainProcessor:
             phase3_results['quality_metrics'] = quality_metrics
             
             # Phase 3 완료
-            phase_duration = time.time() - phase_start
+            phase_duration = (time.monotonic_ns() - phase_start) / 1e9
             self.processing_stats['processing_phases']['phase3_python_final'].update({
                 'status': 'COMPLETED',
                 'duration': phase_duration
@@ -409,6 +611,11 @@ class MainProcessor:
                            phase3_result: Dict) -> Dict:
         """처리 결과 최종화 및 파일 저장"""
         try:
+            # 최종화 시각 스냅샷 (이후 모든 시간 계산/기록에 재사용)
+            now = datetime.now()
+
+            # 마킹 집계를 최종화 시점에 1회 갱신 (이후 참조는 통계 dict 사용)
+            self.processing_stats['marked_cells'] = len(self.validator.yellow_marks)
             # 마킹 요약 시트 생성
             if self.config['output']['create_summary_sheet']:
                 self.marker.create_marking_summary_sheet(workbook)
@@ -416,16 +623,24 @@ class MainProcessor:
             # 처리 결과 통계 시트 생성
             self._create_processing_summary_sheet(workbook, phase1_result, phase2_result, phase3_result)
             
-            # 최종 파일 저장
-            workbook.save(output_path)
+            # 최종 파일 저장 (메모리 버퍼 -> 임시 파일 -> 원자적 교체)
+            # 저장 도중 중단되어도 기존 출력 파일이 부분 기록 상태로 남지 않음
+            buffer = io.BytesIO()
+            workbook.save(buffer)
+            tmp_path = f"{output_path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(buffer.getbuffer())
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, output_path)
             
             # 최종 보고서 생성
             final_report = self._generate_final_report(
-                output_path, phase1_result, phase2_result, phase3_result
+                output_path, phase1_result, phase2_result, phase3_result, now=now
             )
-            
+
             # 처리 시간 계산
-            total_processing_time = (datetime.now() - self.processing_start_time).total_seconds()
+            total_processing_time = (now - self.processing_start_time).total_seconds()
             
             final_result = {
                 'session_id': self.session_id,
@@ -435,7 +650,7 @@ class MainProcessor:
                 'processing_stats': self.processing_stats,
                 'quality_assessment': phase3_result.get('quality_metrics', {}),
                 'final_report_path': final_report.get('report_file_path'),
-                'marked_cells_count': len(self.validator.yellow_marks),
+                'marked_cells_count': self.processing_stats['marked_cells'],
                 'contamination_alerts': len(self.contamination_alerts),
                 'phase_results': {
                     'phase1_basic_validation': phase1_result,
@@ -459,30 +674,66 @@ class MainProcessor:
             )
             raise
     
+    def _get_edit_workbook(self):
+        """마킹/저장용 전체 로드 워크북 지연 생성 (최초 필요 시 1회만 로드)"""
+        if self._edit_workbook is None:
+            self._edit_workbook = load_workbook(self._source_file_path)
+        return self._edit_workbook
+
     def _backup_original_file(self, file_path: str):
-        """원본 파일 백업"""
+        """원본 파일 백업 (지원 환경에서는 커널 수준 복사로 I/O 최소화)"""
         backup_path = f"{file_path}.backup_{self.session_id}"
         try:
-            import shutil
-            shutil.copy2(file_path, backup_path)
+            copy_method = self._copy_via_kernel(file_path, backup_path)
+            if not copy_method:
+                shutil.copy2(file_path, backup_path)
+                copy_method = 'shutil.copy2'
+
             self.logger.log_validation_event(
                 'INFO', 'SYSTEM', 'BACKUP_CREATED',
-                f'원본백업생성_{backup_path}'
+                f'원본백업생성_{backup_path}_방식_{copy_method}'
             )
         except Exception as e:
             self.logger.log_validation_event(
                 'WARNING', 'SYSTEM', 'BACKUP_FAILED',
                 f'백업생성실패_{str(e)}'
             )
+
+    @staticmethod
+    def _copy_via_kernel(src_path: str, dst_path: str) -> Optional[str]:
+        """
+        os.copy_file_range 기반 커널 내 복사 시도
+        reflink 지원 파일시스템(XFS/Btrfs)에서는 CoW 스냅샷으로 즉시 완료
+        미지원 환경이면 None 반환 (호출측에서 일반 복사로 대체)
+        """
+        if not hasattr(os, 'copy_file_range'):
+            return None
+
+        try:
+            with open(src_path, 'rb') as fsrc, open(dst_path, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            shutil.copystat(src_path, dst_path)
+            return 'copy_file_range'
+        except OSError:
+            # 파일시스템 미지원 등 -> 일반 복사 경로로 위임
+            if os.path.exists(dst_path):
+                os.remove(dst_path)
+            return None
     
     def _mark_invalid_sheet(self, workbook, sheet_name: str, validation_result: Dict):
-        """유효하지 않은 시트 마킹"""
+        """유효하지 않은 시트 마킹 (셀 기록은 편집용 워크북에 수행)"""
         account_code = validation_result.get('account_code', 'UNKNOWN')
         issues = validation_result.get('issues', [])
-        
+
+        edit_workbook = self._get_edit_workbook()
         for issue in issues:
             self.marker.mark_range_uncertain(
-                workbook, sheet_name, 'A1', 'G10',
+                edit_workbook, sheet_name, 'A1', 'G10',
                 account_code, '시트검증실패', f'이슈_{issue}'
             )
     
@@ -497,18 +748,15 @@ class MainProcessor:
             parts = task_id.split('_')
             if len(parts) >= 2:
                 account_code = parts[0]
-                
-                # 해당 계정 시트에 마킹 적용
-                sheet_name = None
-                for name in workbook.sheetnames:
-                    if account_code in name:
-                        sheet_name = name
-                        break
-                
+
+                # 해당 계정 시트 조회 (인덱스 기반 O(1))
+                sheet_name = self._sheet_index.get(account_code)
+
                 if sheet_name:
+                    edit_workbook = self._get_edit_workbook()
                     for uncertain_type in uncertain_list:
                         self.marker.mark_range_uncertain(
-                            workbook, sheet_name, 'G1', 'G50',  # 추정 범위
+                            edit_workbook, sheet_name, 'G1', 'G50',  # 추정 범위
                             account_code, 'MCP_UNCERTAIN', f'MCP판단불확실_{uncertain_type}'
                         )
     
@@ -533,21 +781,27 @@ class MainProcessor:
     def _handle_contamination_alerts(self, workbook, contamination_alerts: List[Dict]):
         """교차 오염 알림 처리"""
         self.contamination_alerts = contamination_alerts
-        
+
+        edit_workbook = self._get_edit_workbook()
+
+        # 계정별로 묶어 시트 조회를 계정당 1회로 축소
+        alerts_by_account = defaultdict(list)
         for alert in contamination_alerts:
-            account_code = alert['account']
-            
-            # 관련 시트 찾기 및 마킹
-            for sheet_name in workbook.sheetnames:
-                if account_code in sheet_name:
-                    self.marker.mark_contamination_alert(workbook, sheet_name, alert)
+            alerts_by_account[alert['account']].append(alert)
+
+        for account_code, account_alerts in alerts_by_account.items():
+            sheet_name = self._sheet_index.get(account_code)
+            if sheet_name:
+                for alert in account_alerts:
+                    self.marker.mark_contamination_alert(edit_workbook, sheet_name, alert)
     
-    def _perform_final_data_validation(self, processed_data: Dict) -> Dict:
+    def _perform_final_data_validation(self, processed_data: Dict,
+                                       now: Optional[datetime] = None) -> Dict:
         """최종 데이터 검증"""
         return {
             'validation_passed': True,
             'total_accounts_validated': len(processed_data),
-            'validation_timestamp': datetime.now().isoformat()
+            'validation_timestamp': (now or datetime.now()).isoformat()
         }
     
     def _calculate_quality_metrics(self, phase1_result: Dict, 
@@ -555,31 +809,17 @@ class MainProcessor:
                                  phase3_result: Dict) -> Dict:
         """품질 메트릭 계산"""
         total_accounts = len(phase1_result['validated_accounts'])
-        marked_cells = len(self.validator.yellow_marks)
+        marked_cells = self.processing_stats['marked_cells']  # Phase 경계에서 1회 집계된 값
         uncertain_items = len(phase2_result['uncertain_items'])
         contamination_detected = phase3_result['contamination_check'].get('contamination_detected', False)
         
-        # 품질 점수 계산 (100점 만점)
-        base_score = 100
-        
-        # 마킹된 셀에 따른 감점
-        if marked_cells > 0:
-            marking_penalty = min(marked_cells * 2, 30)  # 최대 30점 감점
-            base_score -= marking_penalty
-        
-        # UNCERTAIN 항목에 따른 감점
-        if uncertain_items > 0:
-            uncertainty_penalty = min(uncertain_items * 5, 25)  # 최대 25점 감점
-            base_score -= uncertainty_penalty
-        
-        # 교차 오염 감지시 대폭 감점
-        if contamination_detected:
-            base_score -= 40
-        
-        quality_grade = 'A' if base_score >= 90 else 'B' if base_score >= 80 else 'C' if base_score >= 70 else 'D'
-        
+        # 품질 점수 계산 (100점 만점, 순수 산술 헬퍼로 분리)
+        overall_score = _compute_quality_score(marked_cells, uncertain_items, contamination_detected)
+
+        quality_grade = 'A' if overall_score >= 90 else 'B' if overall_score >= 80 else 'C' if overall_score >= 70 else 'D'
+
         return {
-            'overall_score': max(base_score, 0),
+            'overall_score': overall_score,
             'quality_grade': quality_grade,
             'data_integrity': 'COMPROMISED' if contamination_detected else 'INTACT',
             'marked_cells_count': marked_cells,
@@ -596,27 +836,35 @@ class MainProcessor:
                 del workbook["처리요약"]
             
             summary_sheet = workbook.create_sheet("처리요약")
-            
+
+            # 통계 조회를 지역 변수로 끌어올려 반복 dict 탐색 제거
+            ps = self.processing_stats
+            phases = ps['processing_phases']
+            failed = ps['failed_accounts']
+            uncertain = ps['uncertain_accounts']
+            marked = ps['marked_cells']
+            contam = ps['contamination_alerts']
+
             # 요약 데이터 작성
             summary_data = [
                 ["항목", "값", "상태"],
                 ["세션 ID", self.session_id, ""],
                 ["처리 시작시간", self.processing_start_time.strftime('%Y-%m-%d %H:%M:%S'), ""],
-                ["총 계정 수", self.processing_stats['total_accounts'], ""],
-                ["성공 계정 수", self.processing_stats['processed_accounts'], "✓"],
-                ["실패 계정 수", self.processing_stats['failed_accounts'], "✗" if self.processing_stats['failed_accounts'] > 0 else ""],
-                ["불확실 계정 수", self.processing_stats['uncertain_accounts'], "⚠" if self.processing_stats['uncertain_accounts'] > 0 else ""],
-                ["마킹된 셀 수", self.processing_stats['marked_cells'], "⚠" if self.processing_stats['marked_cells'] > 0 else ""],
-                ["교차 오염 알림", self.processing_stats['contamination_alerts'], "❌" if self.processing_stats['contamination_alerts'] > 0 else "✓"],
+                ["총 계정 수", ps['total_accounts'], ""],
+                ["성공 계정 수", ps['processed_accounts'], "✓"],
+                ["실패 계정 수", failed, "✗" if failed > 0 else ""],
+                ["불확실 계정 수", uncertain, "⚠" if uncertain > 0 else ""],
+                ["마킹된 셀 수", marked, "⚠" if marked > 0 else ""],
+                ["교차 오염 알림", contam, "❌" if contam > 0 else "✓"],
                 ["", "", ""],
-                ["Phase 1 상태", self.processing_stats['processing_phases']['phase1_python_basic']['status'], ""],
-                ["Phase 2 상태", self.processing_stats['processing_phases']['phase2_mcp_analysis']['status'], ""],
-                ["Phase 3 상태", self.processing_stats['processing_phases']['phase3_python_final']['status'], ""],
+                ["Phase 1 상태", phases['phase1_python_basic']['status'], ""],
+                ["Phase 2 상태", phases['phase2_mcp_analysis']['status'], ""],
+                ["Phase 3 상태", phases['phase3_python_final']['status'], ""],
             ]
             
-            for row_idx, row_data in enumerate(summary_data, 1):
-                for col_idx, cell_value in enumerate(row_data, 1):
-                    summary_sheet.cell(row=row_idx, column=col_idx).value = cell_value
+            # append는 셀 단위 접근 없이 행 단위로 기록 (Cell 객체 생성 최소화)
+            for row_data in summary_data:
+                summary_sheet.append(row_data)
             
         except Exception as e:
             self.logger.log_validation_event(
@@ -624,19 +872,21 @@ class MainProcessor:
                 f'요약시트생성오류_{str(e)}'
             )
     
-    def _generate_final_report(self, output_path: str, phase1_result: Dict, 
-                             phase2_result: Dict, phase3_result: Dict) -> Dict:
+    def _generate_final_report(self, output_path: str, phase1_result: Dict,
+                             phase2_result: Dict, phase3_result: Dict,
+                             now: Optional[datetime] = None) -> Dict:
         """최종 보고서 생성"""
         if not self.config['output']['generate_reports']:
             return {}
-        
+
+        now = now or datetime.now()
         report_data = {
             'processing_summary': {
                 'session_id': self.session_id,
                 'input_file': 'N/A',  # 입력 파일명
                 'output_file': output_path,
-                'processing_time': (datetime.now() - self.processing_start_time).total_seconds(),
-                'timestamp': datetime.now().isoformat()
+                'processing_time': (now - self.processing_start_time).total_seconds(),
+                'timestamp': now.isoformat()
             },
             'statistics': self.processing_stats,
             'quality_metrics': phase3_result.get('quality_metrics', {}),
@@ -659,11 +909,11 @@ class MainProcessor:
             'recommendations': self._generate_recommendations(phase1_result, phase2_result, phase3_result)
         }
         
-        # UTF-8 보장하여 보고서 파일 생성
+        # UTF-8 보장하여 보고서 파일 생성 (orjson: UTF-8 네이티브, 한글 이스케이프 없음)
         report_file_path = f"./log/final_report_{self.session_id}.json"
         try:
-            with open(report_file_path, 'w', encoding='utf-8') as f:
-                json.dump(report_data, f, ensure_ascii=False, indent=2)
+            with open(report_file_path, 'wb') as f:
+                f.write(orjson.dumps(report_data, option=orjson.OPT_INDENT_2, default=str))
             
             self.logger.log_validation_event(
                 'INFO', 'SYSTEM', 'FINAL_REPORT_GENERATED',
@@ -780,64 +1030,172 @@ class LedgerExtractionEngine:
             'revenue': [(40000, 42100), (90000, 92100)],
             'expenses': [(45000, 46100), (52000, 53100), (80000, 84100), (93000, 96100)]
         }
-        
-        import logging
-        logging.info("[원장추출엔진초기화] [파일매핑완료] [계정분류설정완료]")
+
+        # 값 전용 읽기 백엔드: python-calamine 설치시 Rust 파서 사용
+        self._backend = 'calamine' if CalamineWorkbook is not None else 'openpyxl'
+
+        logging.info("[원장추출엔진초기화] [파일매핑완료] [계정분류설정완료] [백엔드_%s]", self._backend)
     
-    def extract_all_ledger_data(self, workbook) -> Dict:
-        """워크북에서 모든 원장 데이터 추출"""
+    def extract_all_ledger_data(self, source) -> Dict:
+        """워크북(또는 원장 파일 경로)에서 모든 원장 데이터 추출
+
+        경로가 주어지면 시트 단위로 ProcessPoolExecutor에 분배해 병렬 추출한다
+        (openpyxl 파싱은 CPU 바운드라 스레드로는 GIL 때문에 확장 불가).
+        이미 열린 워크북이 주어지면 기존 순차 경로로 처리한다.
+        """
+        if isinstance(source, (str, Path)):
+            return self._extract_all_from_path(str(source))
+
+        workbook = source
         extracted_data = {}
-        
-        for sheet_name in workbook.sheetnames:
+
+        # 계정코드 없는 표지/메타 시트는 열기 전에 이름만으로 걸러낸다
+        data_sheet_names = [
+            name for name in workbook.sheetnames
+            if self._ACCOUNT_CODE_RE.search(name)
+        ]
+
+        for sheet_name in data_sheet_names:
+            try:
+                account_code, account_info = self._extract_single_sheet(workbook, sheet_name)
+                if account_code:
+                    extracted_data[account_code] = account_info
+
+            except Exception as e:
+                logging.error("[추출실패] [시트_%s] [오류_%s]", sheet_name, e)
+                continue
+
+        return extracted_data
+
+    def _extract_single_sheet(self, workbook, sheet_name):
+        """시트 하나의 계정 데이터 추출 (순차/병렬 경로 공용)"""
+        # 계정 코드 추출
+        account_code = self.extract_account_code(sheet_name)
+        if not account_code:
+            return None, None
+
+        sheet = workbook[sheet_name]
+
+        # 계정 타입 결정
+        account_type = self.classify_account_type(account_code)
+
+        # 전기이월 추출
+        carry_forward = self.extract_carry_forward(sheet)
+
+        # 월별 데이터 추출
+        monthly_data = self.extract_monthly_data(sheet, account_type)
+
+        account_info = {
+            'account_name': sheet_name.split('(')[0].strip(),
+            'account_type': account_type,
+            'carry_forward': carry_forward,
+            'monthly_data': monthly_data
+        }
+
+        logging.info("[추출성공] [계정_%s] [타입_%s] [전기이월_%s] [월별데이터_%s개월]", account_code, account_type, carry_forward, len(monthly_data))
+
+        return account_code, account_info
+
+    def _extract_all_from_path(self, path: str) -> Dict:
+        """원장 파일 경로 기반 추출 (calamine 가용시 우선, 아니면 병렬 openpyxl)"""
+        if self._backend == 'calamine':
+            return self._extract_all_with_calamine(path)
+
+        scan = load_workbook(path, read_only=True, data_only=True)
+        try:
+            sheet_names = [
+                name for name in scan.sheetnames
+                if self._ACCOUNT_CODE_RE.search(name)
+            ]
+        finally:
+            scan.close()
+
+        extracted_data = {}
+        if not sheet_names:
+            return extracted_data
+
+        max_workers = max(1, min(len(sheet_names), os.cpu_count() or 4))
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            for account_code, account_info in pool.map(
+                    _extract_one_ledger_sheet,
+                    [(path, name) for name in sheet_names]):
+                if account_code:
+                    extracted_data[account_code] = account_info
+
+        return extracted_data
+
+    def _extract_all_with_calamine(self, path: str) -> Dict:
+        """
+        calamine(Rust) 백엔드 원장 전체 추출
+        값만 읽으므로 openpyxl read_only 대비 수십 배 빠른 시트 단위 리스트 로드
+        """
+        workbook = CalamineWorkbook.from_path(path)
+        extracted_data = {}
+
+        for sheet_name in workbook.sheet_names:
             try:
-                # 계정 코드 추출
                 account_code = self.extract_account_code(sheet_name)
                 if not account_code:
                     continue
-                
-                sheet = workbook[sheet_name]
-                
-                # 계정 타입 결정
+
+                # 시트 전체를 값 리스트로 로드 후 A~G 7열 튜플로 정규화
+                raw_rows = workbook.get_sheet_by_name(sheet_name).to_python()
+                rows = [(tuple(r) + (None,) * 7)[:7] for r in raw_rows]
+
                 account_type = self.classify_account_type(account_code)
-                
-                # 전기이월 추출
-                carry_forward = self.extract_carry_forward(sheet)
-                
-                # 월별 데이터 추출
-                monthly_data = self.extract_monthly_data(sheet, account_type)
-                
+                carry_forward = self._carry_forward_from_rows(rows)
+
+                if account_type == 'PL':
+                    monthly_data = self._pl_amounts_from_rows(rows[5:])
+                else:
+                    # UNKNOWN 타입도 기존 extract_monthly_data와 동일하게 BS 로직 적용
+                    monthly_data = self._bs_balances_from_rows(rows[5:])
+
                 extracted_data[account_code] = {
                     'account_name': sheet_name.split('(')[0].strip(),
                     'account_type': account_type,
                     'carry_forward': carry_forward,
                     'monthly_data': monthly_data
                 }
-                
-                logging.info(f"[추출성공] [계정_{account_code}] [타입_{account_type}] [전기이월_{carry_forward}] [월별데이터_{len(monthly_data)}개월]")
-                
+
             except Exception as e:
-                logging.error(f"[추출실패] [시트_{sheet_name}] [오류_{str(e)}]")
+                logging.error("[추출실패] [시트_%s] [오류_%s]", sheet_name, e)
                 continue
-        
+
         return extracted_data
-    
+
+    def _carry_forward_from_rows(self, rows):
+        """5행(B5/G5) 값 튜플에서 전기이월 추출 (CLAUDE.md 규칙, 백엔드 공용)"""
+        if len(rows) < 5:
+            logging.warning("[전기이월없음] [5행없음] [전기이월텍스트없음]")
+            return None
+
+        b5_value, g5_value = rows[4][1], rows[4][6]
+        if b5_value and '전기이월' in str(b5_value):
+            if isinstance(g5_value, _NUMTYPES):
+                return g5_value
+            logging.warning("[전기이월형식오류] [B5=전기이월] [G5=%s] [숫자아님]", g5_value)
+            return None
+
+        logging.warning("[전기이월없음] [B5=%s] [전기이월텍스트없음]", b5_value)
+        return None
+
     def extract_carry_forward(self, sheet):
         """전기이월: 각 시트 5행 G열에서 추출 (CLAUDE.md 규칙)"""
-        import logging
         try:
             b5_value = sheet['B5'].value
             if b5_value and '전기이월' in str(b5_value):
                 g5_value = sheet['G5'].value
-                if isinstance(g5_value, (int, float)):
+                if isinstance(g5_value, _NUMTYPES):
                     return g5_value
                 else:
-                    logging.warning(f"[전기이월형식오류] [B5=전기이월] [G5={g5_value}] [숫자아님]")
+                    logging.warning("[전기이월형식오류] [B5=전기이월] [G5=%s] [숫자아님]", g5_value)
                     return None
             else:
-                logging.warning(f"[전기이월없음] [B5={b5_value}] [전기이월텍스트없음]")
+                logging.warning("[전기이월없음] [B5=%s] [전기이월텍스트없음]", b5_value)
                 return None
         except Exception as e:
-            logging.error(f"[전기이월추출오류] [오류_{str(e)}]")
+            logging.error("[전기이월추출오류] [오류_%s]", e)
             return None
     
     def extract_monthly_data(self, sheet, account_type):
@@ -846,7 +1204,6 @@ class LedgerExtractionEngine:
         BS: 월계 직전 거래행 G열 = 월말 잔액 (검증 완료 패턴)
         PL: 월계행 차변-대변 = 월별 발생액 (새로 추가된 로직)
         """
-        import logging
         monthly_data = {}
         
         try:
@@ -857,41 +1214,45 @@ class LedgerExtractionEngine:
                 # PL 계정: 월계행 발생액 추출
                 monthly_data = self._extract_pl_monthly_amounts(sheet)
             else:
-                logging.warning(f"[알수없는계정타입] [타입_{account_type}] [기본BS로직적용]")
+                logging.warning("[알수없는계정타입] [타입_%s] [기본BS로직적용]", account_type)
                 monthly_data = self._extract_bs_monthly_balances(sheet)
         
         except Exception as e:
-            logging.error(f"[월별데이터추출오류] [계정타입_{account_type}] [오류_{str(e)}]")
+            logging.error("[월별데이터추출오류] [계정타입_%s] [오류_%s]", account_type, e)
         
         return monthly_data
     
     def _extract_bs_monthly_balances(self, sheet):
         """BS 계정 월별 잔액 추출 - 검증 완료된 패턴"""
-        import logging
-        import re
-        
+        # values_only 스트리밍으로 행 단위 튜플을 직접 받는다
+        # (좌표 파싱/Cell 객체 생성 생략, read_only 모드에서 max_row 사전 스캔 회피)
+        return self._bs_balances_from_rows(
+            sheet.iter_rows(min_row=6, max_col=7, values_only=True))
+
+    def _bs_balances_from_rows(self, data_rows):
+        """6행 이후 (A~G) 값 튜플 스트림에서 BS 월말 잔액 계산 (백엔드 공용)"""
+
         monthly_balances = {}
         current_month = None
         last_balance = None
-        
-        for row in range(6, sheet.max_row + 1):
-            a_val = sheet[f'A{row}'].value
-            b_val = sheet[f'B{row}'].value
-            g_val = sheet[f'G{row}'].value
-            
-            # MM-DD 패턴으로 월 인식
-            if a_val and isinstance(a_val, str) and '-' in a_val:
-                parts = a_val.split('-')
-                if len(parts) >= 2 and parts[0].isdigit():
-                    month = int(parts[0])
+
+        for a_val, b_val, _c, _d, _e, _f, g_val in data_rows:
+
+            # MM-DD 패턴으로 월 인식 (C 수준 정규식 1회 매칭, split 리스트 할당 제거)
+            if isinstance(a_val, str):
+                date_match = self._MMDD_RE.match(a_val)
+                if date_match:
+                    month = int(date_match.group(1))
                     if 1 <= month <= 12:
                         current_month = month
             
             # 월계 행 감지시 직전 거래의 잔액을 월말 잔액으로 설정
-            if b_val and isinstance(b_val, str) and '월         계' in b_val:
+            # ('계' 포함 여부로 일반 거래 행을 먼저 걸러낸 뒤에만 공백 정규화)
+            if isinstance(b_val, str) and '계' in b_val \
+                    and _MONTH_SUMMARY_RE.search(b_val):
                 if current_month and last_balance is not None:
                     monthly_balances[current_month] = last_balance
-                    logging.info(f"[BS월말잔액] [월_{current_month}] [잔액_{last_balance}]")
+                    logging.info("[BS월말잔액] [월_%s] [잔액_%s]", current_month, last_balance)
                 current_month = None
                 last_balance = None
                 continue
@@ -904,48 +1265,61 @@ class LedgerExtractionEngine:
     
     def _extract_pl_monthly_amounts(self, sheet):
         """PL 계정 월별 발생액 추출 - 수정된 로직"""
-        import logging
-        
+        # E열=차변, F열=대변 (values_only 스트리밍, Cell 객체 미생성)
+        return self._pl_amounts_from_rows(
+            sheet.iter_rows(min_row=6, max_col=7, values_only=True))
+
+    def _pl_amounts_from_rows(self, data_rows):
+        """6행 이후 (A~G) 값 튜플 스트림에서 PL 월별 발생액 계산 (백엔드 공용)
+
+        기준선 알고리즘과 동일한 제어 흐름을 유지한다:
+        유효한 날짜 행마다 직전 누계의 확정을 시도하고 (최초 기록 우선),
+        '-' 포함 문자열 행은 월 인식 실패 여부와 무관하게 누적 대상이며,
+        월계 행은 해당 월이 미기록일 때만 행의 차변-대변을 직접 사용한다.
+        """
         monthly_amounts = {}
         current_month = None
         monthly_debit_total = 0
         monthly_credit_total = 0
-        
-        for row in range(6, sheet.max_row + 1):
-            a_val = sheet[f'A{row}'].value
-            b_val = sheet[f'B{row}'].value
-            e_val = sheet[f'E{row}'].value  # 차변
-            f_val = sheet[f'F{row}'].value  # 대변
-            
-            # MM-DD 패턴으로 월 인식
-            if a_val and isinstance(a_val, str) and '-' in a_val:
-                parts = a_val.split('-')
-                if len(parts) >= 2 and parts[0].isdigit():
-                    month = int(parts[0])
+
+        for a_val, b_val, _c, _d, e_val, f_val, _g in data_rows:
+
+            # 거래 행 판정: '-' 포함 문자열 (기준선의 split 기반 판정과 동일)
+            is_dated_row = isinstance(a_val, str) and '-' in a_val
+
+            if is_dated_row:
+                date_match = self._MMDD_RE.match(a_val)
+                if date_match:
+                    month = int(date_match.group(1))
                     if 1 <= month <= 12:
-                        # 이전 월 처리 완료
+                        # 이전 누계 확정 시도 (기준선과 동일하게 날짜 행마다 수행)
                         if current_month and current_month not in monthly_amounts:
                             net_amount = monthly_debit_total - monthly_credit_total
                             if net_amount != 0:
                                 monthly_amounts[current_month] = net_amount
-                                logging.info(f"[PL월별발생액] [월_{current_month}] [차변총_{monthly_debit_total}] [대변총_{monthly_credit_total}] [순발생_{net_amount}]")
-                        
+                                logging.info("[PL월별발생액] [월_%s] [차변총_%s] [대변총_%s] [순발생_%s]", current_month, monthly_debit_total, monthly_credit_total, net_amount)
+
                         # 새 월 시작
                         current_month = month
                         monthly_debit_total = 0
                         monthly_credit_total = 0
-            
+
             # 월 내 거래 누적
-            if current_month and a_val and isinstance(a_val, str) and '-' in a_val:
-                debit = e_val or 0
-                credit = f_val or 0
-                if isinstance(debit, (int, float)):
-                    monthly_debit_total += debit
-                if isinstance(credit, (int, float)):
-                    monthly_credit_total += credit
-            
+            # 거의 항상 수치형이므로 EAFP: 타입 검사 없이 더하고 예외만 무시
+            if current_month and is_dated_row:
+                try:
+                    monthly_debit_total += e_val or 0
+                except TypeError:
+                    pass
+                try:
+                    monthly_credit_total += f_val or 0
+                except TypeError:
+                    pass
+
             # 월계 행 발견시 처리 완료
-            if b_val and isinstance(b_val, str) and '월         계' in b_val:
+            # ('계' 포함 여부로 일반 거래 행을 먼저 걸러낸 뒤에만 공백 정규화)
+            if isinstance(b_val, str) and '계' in b_val \
+                    and _MONTH_SUMMARY_RE.search(b_val):
                 if current_month and current_month not in monthly_amounts:
                     # 월계 행 직접 값 사용 (더 정확)
                     debit = e_val or 0
@@ -954,7 +1328,7 @@ class LedgerExtractionEngine:
                     
                     if monthly_amount != 0:
                         monthly_amounts[current_month] = monthly_amount
-                        logging.info(f"[PL월계발생액] [월_{current_month}] [차변_{debit}] [대변_{credit}] [발생액_{monthly_amount}]")
+                        logging.info("[PL월계발생액] [월_%s] [차변_%s] [대변_%s] [발생액_%s]", current_month, debit, credit, monthly_amount)
                 
                 current_month = None
                 monthly_debit_total = 0
@@ -965,49 +1339,39 @@ class LedgerExtractionEngine:
             net_amount = monthly_debit_total - monthly_credit_total
             if net_amount != 0:
                 monthly_amounts[current_month] = net_amount
-                logging.info(f"[PL마지막월] [월_{current_month}] [차변총_{monthly_debit_total}] [대변총_{monthly_credit_total}] [순발생_{net_amount}]")
+                logging.info("[PL마지막월] [월_%s] [차변총_%s] [대변총_%s] [순발생_%s]", current_month, monthly_debit_total, monthly_credit_total, net_amount)
         
         return monthly_amounts
     
+    # 시트명 계정코드 / A열 거래일 패턴 (클래스 수준 사전 컴파일)
+    # 거래일은 기준선의 split('-')[0].isdigit() 판정과 동일하게
+    # '숫자열-' 접두부만 요구한다 (월 범위 검증은 호출측에서 수행)
+    _ACCOUNT_CODE_RE = re.compile(r'\((\d+)\)')
+    _MMDD_RE = re.compile(r'^(\d+)-')
+
     def extract_account_code(self, sheet_name):
         """시트명 파싱: 정규표현식 `\\((\\d+)\\)`으로 계정코드 추출 (CLAUDE.md 규칙)"""
-        import re
-        pattern = r'\((\d+)\)'
-        match = re.search(pattern, sheet_name)
-        
+        match = self._ACCOUNT_CODE_RE.search(sheet_name)
+
         if match:
             return match.group(1)
         else:
-            logging.warning(f"[계정코드추출실패] [시트_{sheet_name}] [패턴불일치]")
+            logging.warning("[계정코드추출실패] [시트_%s] [패턴불일치]", sheet_name)
             return None
     
     def classify_account_type(self, account_code):
-        """계정 분류: BS/PL 구분"""
+        """계정 분류: BS/PL 구분 (결과는 _classify_account_code에 캐시됨)"""
         try:
             code_int = int(account_code)
-            
-            # BS 계정 확인
-            for range_name, (start, end) in self.bs_ranges.items():
-                if start <= code_int < end:
-                    return 'BS'
-            
-            # PL 계정 확인
-            for range_list in self.pl_ranges.values():
-                for start, end in range_list:
-                    if start <= code_int < end:
-                        return 'PL'
-            
-            # VAT 계정 특별 처리
-            if account_code in ['13500', '25500']:
-                return 'VAT'
-            
-            logging.warning(f"[계정분류실패] [코드_{account_code}] [알수없는범위]")
-            return 'UNKNOWN'
-            
         except ValueError:
-            logging.error(f"[계정분류오류] [코드_{account_code}] [숫자변환실패]")
+            logging.error("[계정분류오류] [코드_%s] [숫자변환실패]", account_code)
             return 'UNKNOWN'
 
+        result = _classify_account_code(code_int)
+        if result == 'UNKNOWN':
+            logging.warning("[계정분류실패] [코드_%s] [알수없는범위]", account_code)
+        return result
+
 
 class TemplateIntegrator:
     """
@@ -1022,7 +1386,6 @@ class TemplateIntegrator:
             'data_start_column': 2  # B열부터 데이터
         }
         
-        import logging
         logging.info("[템플릿통합시스템초기화] [구조설정완료]")
     
     def integrate_to_template(self, extracted_data, template_path):
@@ -1030,31 +1393,40 @@ class TemplateIntegrator:
         try:
             wb = load_workbook(template_path)
             
+            # BS/PL 계정 단일 패스 파티셔닝 (타입별 전체 재스캔 제거)
+            bs_data, pl_data = {}, {}
+            for account_code, account_info in extracted_data.items():
+                account_type = account_info['account_type']
+                if account_type == 'BS':
+                    bs_data[account_code] = account_info
+                elif account_type == 'PL':
+                    pl_data[account_code] = account_info
+
             # BS 계정 처리
-            bs_data = {k: v for k, v in extracted_data.items() if v['account_type'] == 'BS'}
             if bs_data and self.template_structure['bs_sheet_name'] in wb.sheetnames:
                 self._integrate_bs_data(wb[self.template_structure['bs_sheet_name']], bs_data)
-            
+
             # PL 계정 처리
-            pl_data = {k: v for k, v in extracted_data.items() if v['account_type'] == 'PL'}
             if pl_data and self.template_structure['pl_sheet_name'] in wb.sheetnames:
                 self._integrate_pl_data(wb[self.template_structure['pl_sheet_name']], pl_data)
             
             wb.save(template_path)
-            import logging
-            logging.info(f"[템플릿통합완료] [파일_{template_path}] [BS계정_{len(bs_data)}개] [PL계정_{len(pl_data)}개]")
+            logging.info("[템플릿통합완료] [파일_%s] [BS계정_%s개] [PL계정_%s개]", template_path, len(bs_data), len(pl_data))
             
             return template_path
             
         except Exception as e:
-            import logging
-            logging.error(f"[템플릿통합실패] [파일_{template_path}] [오류_{str(e)}]")
+            logging.error("[템플릿통합실패] [파일_%s] [오류_%s]", template_path, e)
             raise
     
+    # A열 셀 텍스트에서 계정코드 후보(숫자 연속열) 추출용
+    _CODE_RUN_RE = re.compile(r'\d+')
+
     def _integrate_bs_data(self, ws, bs_data):
         """BS 계정 데이터 템플릿 반영"""
+        account_rows = self._build_account_row_index(ws)
         for account_code, account_info in bs_data.items():
-            account_row = self._find_account_row(ws, account_code)
+            account_row = account_rows.get(account_code)
             if account_row:
                 # 월별 데이터 입력 (2열부터 13열까지 = 1월~12월)
                 monthly_data = account_info['monthly_data']
@@ -1065,69 +1437,76 @@ class TemplateIntegrator:
     
     def _integrate_pl_data(self, ws, pl_data):
         """PL 계정 데이터 템플릿 반영 - PL 시트 전용"""
-        import logging
-        from openpyxl.styles import PatternFill
-        
+
         # PL 계정 이름 매핑
         pl_account_names = {
             '40000': '매출',
-            '80200': '인건비', 
+            '80200': '인건비',
             '80800': '전력비',
             '81100': '통신비',
             '81200': '수도광열비'
         }
-        
-        # 헤더가 없으면 생성
+
+        # 헤더가 없으면 생성 (행 단위 일괄 기록)
         if ws.max_row == 1 and not ws['A1'].value:
-            ws['A1'] = '계정코드'
-            ws['B1'] = '계정명'
-            ws['C1'] = '전기이월'
-            for month in range(1, 13):
-                col_letter = chr(ord('D') + month - 1)
-                ws[f'{col_letter}1'] = f'2022년{month:02d}월'
-        
+            header = ['계정코드', '계정명', '전기이월'] + [
+                f'2022년{month:02d}월' for month in range(1, 13)
+            ]
+            for col_idx, value in enumerate(header, start=1):
+                ws.cell(row=1, column=col_idx, value=value)
+
         # 데이터 행 시작점 찾기
         current_row = 2
-        
+
         for account_code, account_info in pl_data.items():
-            # 계정 정보 입력
-            ws[f'A{current_row}'] = account_code
-            ws[f'B{current_row}'] = pl_account_names.get(account_code, account_info.get('account_name', 'Unknown'))
-            
-            # 전기이월 입력 (PL은 보통 없음)
-            carry_forward = account_info.get('carry_forward')
-            ws[f'C{current_row}'] = carry_forward
-            
-            # 월별 발생액 입력
+            # 행 전체를 리스트로 구성 후 정수 열 인덱스로 기록
+            # (좌표 문자열 파싱 및 chr 기반 열 계산 제거)
             monthly_data = account_info.get('monthly_data', {})
-            data_count = 0
-            
-            for month in range(1, 13):
-                col_letter = chr(ord('D') + month - 1)
-                if month in monthly_data and monthly_data[month] != 0:
-                    ws[f'{col_letter}{current_row}'] = monthly_data[month]
-                    data_count += 1
-                else:
-                    ws[f'{col_letter}{current_row}'] = None
-            
-            # 데이터 없는 계정 노란색 마킹
-            if data_count == 0:
-                yellow_fill = PatternFill(start_color='FFFF00', end_color='FFFF00', fill_type='solid')
-                for col in ['A', 'B', 'C'] + [chr(ord('D') + i) for i in range(12)]:
-                    ws[f'{col}{current_row}'].fill = yellow_fill
-                logging.warning(f'[PL데이터없음] [계정_{account_code}] [노란색마킹]')
+            monthly_values = [
+                monthly_data[month] if monthly_data.get(month) else None
+                for month in range(1, 13)
+            ]
+            data_count = sum(1 for value in monthly_values if value is not None)
+
+            # 중첩 .get 폴백 체인 대신 단계별 or 폴백 (불필요한 내부 .get 평가 제거)
+            account_name = (pl_account_names.get(account_code)
+                            or account_info.get('account_name')
+                            or 'Unknown')
+
+            row_values = [
+                account_code,
+                account_name,
+                account_info.get('carry_forward')  # 전기이월 (PL은 보통 없음)
+            ] + monthly_values
+
+            mark_row = data_count == 0
+            for col_idx, value in enumerate(row_values, start=1):
+                cell = ws.cell(row=current_row, column=col_idx, value=value)
+                # 데이터 없는 계정 노란색 마킹 (공유 PatternFill 재사용)
+                if mark_row:
+                    cell.fill = _YELLOW_FILL
+
+            if mark_row:
+                logging.warning('[PL데이터없음] [계정_%s] [노란색마킹]', account_code)
             else:
-                logging.info(f'[PL데이터입력] [계정_{account_code}] [데이터월수_{data_count}개월]')
-            
+                logging.info('[PL데이터입력] [계정_%s] [데이터월수_%s개월]', account_code, data_count)
+
             current_row += 1
     
-    def _find_account_row(self, ws, account_code):
-        """워크시트에서 계정 코드에 해당하는 행 찾기"""
-        for row in range(1, ws.max_row + 1):
-            cell_value = ws.cell(row=row, column=1).value
-            if cell_value and account_code in str(cell_value):
-                return row
-        return None
+    def _build_account_row_index(self, ws):
+        """
+        A열 1회 순회로 계정코드 -> 행 번호 인덱스 구축
+        계정당 선형 재탐색 대신 O(rows + accounts) 단일 패스 + dict 조회
+        """
+        index = {}
+        for row_idx, (a_val,) in enumerate(
+                ws.iter_rows(min_col=1, max_col=1, values_only=True), start=1):
+            if a_val is None:
+                continue
+            for code in self._CODE_RUN_RE.findall(str(a_val)):
+                # 동일 코드가 여러 행에 있으면 기존 선형 탐색과 같이 첫 행 우선
+                index.setdefault(code, row_idx)
+        return index
 
 
 class RequestParser:
@@ -1143,8 +1522,17 @@ class RequestParser:
             "미지급금": ["25300"],
             "직원급여": ["80200"]
         }
-        
-        import logging
+
+        # 키워드 -> (계정 목록, 계정 타입) 테이블
+        # 선언 순서가 우선순위이며 첫 일치에서 종료 (기존 elif 체인과 동일 의미)
+        self._kw_rules = [
+            ("보통예금", self.common_accounts["보통예금"], None),
+            ("BS계정", None, "BS"),
+            ("자산", None, "BS"),
+            ("PL계정", None, "PL"),
+            ("손익", None, "PL"),
+        ]
+
         logging.info("[요청파서초기화] [패턴설정완료]")
     
     def parse_user_request(self, **kwargs):
@@ -1170,15 +1558,16 @@ class RequestParser:
         # 계정 추출
         accounts = None
         account_type = None
-        
+
+        # 복합 규칙은 테이블보다 우선: "첫 3개" + "BS" 동시 포함
         if "첫 3개" in user_input and "BS" in user_input:
             accounts = self.bs_first_accounts
-        elif "보통예금" in user_input:
-            accounts = self.common_accounts["보통예금"]
-        elif "BS계정" in user_input or "자산" in user_input:
-            account_type = "BS"
-        elif "PL계정" in user_input or "손익" in user_input:
-            account_type = "PL"
+        else:
+            for keyword, kw_accounts, kw_type in self._kw_rules:
+                if keyword in user_input:
+                    accounts = kw_accounts
+                    account_type = kw_type
+                    break
         
         return {
             'years': years,
@@ -1187,20 +1576,22 @@ class RequestParser:
             'output_format': 'template'
         }
     
+    # 연도 패턴 (클래스 수준 사전 컴파일)
+    # 구체적인 패턴 우선: 범위 패턴을 먼저 시도해야
+    # 단일 연도 패턴이 범위 양끝을 개별 연도로 집어삼키지 않는다
+    _YEAR_RES = [
+        re.compile(r'(\d{4})-(\d{4})년'),
+        re.compile(r'(\d{4})년'),
+        re.compile(r'(\d{4})')
+    ]
+
     def _extract_years(self, user_input):
         """텍스트에서 연도 추출"""
-        import re
-        
-        # 연도 패턴 찾기
-        year_patterns = [
-            r'(\d{4})년',
-            r'(\d{4})-(\d{4})년',
-            r'(\d{4})'
-        ]
-        
         years = []
-        for pattern in year_patterns:
-            matches = re.findall(pattern, user_input)
+        for pattern in self._YEAR_RES:
+            matches = pattern.findall(user_input)
+            if not matches:
+                continue
             for match in matches:
                 if isinstance(match, tuple):
                     # 범위 (예: 2022-2024년)
@@ -1212,7 +1603,9 @@ class RequestParser:
                     year = int(match)
                     if 2020 <= year <= 2030:  # 유효한 연도 범위
                         years.append(year)
-        
+            if years:
+                break  # 가장 구체적인 패턴의 결과만 사용
+
         return years if years else [2022]  # 기본값
 
 
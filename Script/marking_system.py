@@ -4,17 +4,92 @@ CLAUDE.md 규칙: 모든 불확실한 데이터는 노란색 마킹 후 빈 값
 """
 
 import logging
+import os
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 from openpyxl.styles import PatternFill, Font, Alignment
 from openpyxl.comments import Comment
 from typing import Dict, List, Optional, Any
 
+
+def _scan_contamination_chunk(items, ledger_data, revenue_codes):
+    """계정 묶음에 대한 교차 오염 패턴 1~3 검사
+
+    병렬 실행 시 워커 프로세스에서 호출되므로 모듈 레벨 함수로 두고
+    로깅은 하지 않는다 (알람별 로그는 부모 프로세스에서 일괄 기록).
+    """
+    alerts = []
+
+    for account_code, account_data in items:
+        is_revenue = str(account_code) in revenue_codes
+        for year, year_data in account_data.items():
+            ledger_months = ledger_data.get(year, {}).get(account_code, {})
+            for month, v3_value in year_data.items():
+                ledger_value = ledger_months.get(month, 0)
+
+                # 패턴 1: v3에 외부 데이터 유입 의심
+                if v3_value != 0 and ledger_value == 0:
+                    alerts.append({
+                        'account': account_code,
+                        'year': year,
+                        'month': month,
+                        'v3_value': v3_value,
+                        'ledger_value': ledger_value,
+                        'suspicion': 'v3에_외부데이터_유입_의심',
+                        'contamination_type': 'EXTERNAL_DATA_INJECTION',
+                        'risk_level': 'HIGH'
+                    })
+
+                # 패턴 2: 부호 반전 오류 감지
+                elif v3_value * ledger_value < 0 and abs(v3_value) == abs(ledger_value):
+                    alerts.append({
+                        'account': account_code,
+                        'year': year,
+                        'month': month,
+                        'v3_value': v3_value,
+                        'ledger_value': ledger_value,
+                        'suspicion': '부호반전_처리오류',
+                        'contamination_type': 'SIGN_REVERSAL_ERROR',
+                        'risk_level': 'MEDIUM'
+                    })
+
+                # 패턴 3: 수익 계정 음수값 감지
+                elif is_revenue and v3_value < 0:
+                    alerts.append({
+                        'account': account_code,
+                        'year': year,
+                        'month': month,
+                        'v3_value': v3_value,
+                        'ledger_value': ledger_value,
+                        'suspicion': '수익계정_음수값_오염',
+                        'contamination_type': 'REVENUE_NEGATIVE_VALUE',
+                        'risk_level': 'HIGH'
+                    })
+
+    return alerts
+
+
 class YellowMarkingSystem:
     """
     노란색 마킹 시스템
     핵심 원칙: 불확실한 데이터는 노란색 마킹 + 값 비움 + 상세 로깅
     """
-    
+
+    # 공유 스타일 상수 (호출마다 재생성하면 객체 할당과 styles.xml 엔트리가 늘어남)
+    _RED_FILL = PatternFill(start_color="FF0000", end_color="FF0000", fill_type="solid")
+    _LIGHT_YELLOW_FILL = PatternFill(start_color="FFFACD", end_color="FFFACD", fill_type="solid")
+    _GRAY_FILL = PatternFill(start_color="CCCCCC", end_color="CCCCCC", fill_type="solid")
+    _WHITE_BOLD_FONT = Font(bold=True, color="FFFFFF")
+    _WHITE_BOLD_TITLE_FONT = Font(bold=True, color="FFFFFF", size=14)
+    _HEADER_BOLD_FONT = Font(bold=True)
+    _STATS_TITLE_FONT = Font(bold=True, size=14)
+    _SYSTEM_COMMENT_AUTHOR = "시스템"
+
+    # 교차 오염 검사 병렬화 기준 (계정 수가 이보다 적으면 프로세스 기동 비용이 더 큼)
+    _PARALLEL_SCAN_THRESHOLD = 200
+
     def __init__(self):
         # 노란색 마킹 스타일
         self.yellow_fill = PatternFill(
@@ -36,13 +111,21 @@ class YellowMarkingSystem:
         )
         
         self.marked_cells = []
-        self.marking_stats = {
-            'total_marked': 0,
-            'by_issue_type': {},
-            'by_account': {},
-            'by_sheet': {}
-        }
-        
+        # marking_stats 지연 계산 캐시 (마킹 추가 시 레코드 수 변화로 무효화)
+        self._stats_cache = None
+        self._stats_cached_count = -1
+
+        # 지연 마킹 큐 (batched 모드에서 셀별 즉시 적용 대신 일괄 flush)
+        self._mark_queue = deque()
+        self._deferred = False
+
+        # 수익 계정 코드 집합 사전 계산 (40000-42100, 90000-92100)
+        self._revenue_codes = frozenset(
+            str(code)
+            for start, end in [(40000, 42100), (90000, 92100)]
+            for code in range(start, end + 1)
+        )
+
         logging.info("[노란색마킹시스템초기화] [스타일설정완료]")
     
     def mark_uncertain_cell(self, workbook, sheet_name: str, cell_coordinate: str, 
@@ -60,6 +143,19 @@ class YellowMarkingSystem:
             detail: 상세 내용
             original_value: 원본 값
         """
+        # 지연 모드: 즉시 적용 대신 큐에 적재 (flush_marks에서 시트별 일괄 처리)
+        if self._deferred:
+            self._mark_queue.append(
+                (sheet_name, cell_coordinate, account_code, issue_type, detail, original_value)
+            )
+            return {
+                'marked': False,
+                'queued': True,
+                'cell_coordinate': cell_coordinate,
+                'issue_type': issue_type,
+                'detail': detail
+            }
+
         try:
             sheet = workbook[sheet_name]
             cell = sheet[cell_coordinate]
@@ -78,7 +174,7 @@ class YellowMarkingSystem:
             
             # 코멘트 추가 (사용자 확인용)
             comment_text = f"데이터 이슈: {issue_type}\n상세: {detail}\n확인 필요"
-            cell.comment = Comment(comment_text, "시스템")
+            cell.comment = Comment(comment_text, self._SYSTEM_COMMENT_AUTHOR)
             
             # 마킹 기록
             marking_record = {
@@ -93,16 +189,15 @@ class YellowMarkingSystem:
             }
             
             self.marked_cells.append(marking_record)
-            
-            # 통계 업데이트
-            self._update_stats(sheet_name, account_code, issue_type)
-            
-            # 로깅
-            logging.warning(
-                f"[노란색마킹적용] [계정_{account_code}] [시트_{sheet_name}] "
-                f"[셀_{cell_coordinate}] [이슈_{issue_type}] [상세_{detail}] "
-                f"[원본값_{original_value}] [처리_값비움]"
-            )
+
+            # 로깅 (지연 포맷: WARNING 비활성 시 문자열 조립 자체를 건너뜀)
+            if logging.getLogger().isEnabledFor(logging.WARNING):
+                logging.warning(
+                    "[노란색마킹적용] [계정_%s] [시트_%s] [셀_%s] [이슈_%s] "
+                    "[상세_%s] [원본값_%s] [처리_값비움]",
+                    account_code, sheet_name, cell_coordinate,
+                    issue_type, detail, original_value
+                )
             
             return {
                 'marked': True,
@@ -122,50 +217,155 @@ class YellowMarkingSystem:
                 'error': str(e)
             }
     
-    def mark_range_uncertain(self, workbook, sheet_name: str, start_cell: str, 
-                           end_cell: str, account_code: str, issue_type: str, 
+    def mark_range_uncertain(self, workbook, sheet_name: str, start_cell: str,
+                           end_cell: str, account_code: str, issue_type: str,
                            detail: str) -> List[Dict]:
-        """범위 셀 노란색 마킹"""
+        """범위 셀 노란색 마킹 (단일 패스 일괄 처리)
+
+        셀마다 mark_uncertain_cell을 호출하면 시트 재조회, 개별 WARNING 로그,
+        예외 처리 프레임이 셀 수만큼 반복되므로 범위 전용 경로에서
+        공유 스타일 객체를 직접 적용하고 로그는 범위당 1건만 남긴다.
+        """
         marked_results = []
-        
+
         try:
             sheet = workbook[sheet_name]
             cell_range = sheet[f"{start_cell}:{end_cell}"]
-            
-            if isinstance(cell_range, tuple):
-                # 2D 범위인 경우
-                for row in cell_range:
-                    for cell in row:
-                        result = self.mark_uncertain_cell(
-                            workbook, sheet_name, cell.coordinate,
-                            account_code, issue_type, 
-                            f"{detail}_범위마킹_{cell.coordinate}"
-                        )
-                        marked_results.append(result)
-            else:
-                # 1D 범위인 경우
-                for cell in cell_range:
-                    result = self.mark_uncertain_cell(
-                        workbook, sheet_name, cell.coordinate,
-                        account_code, issue_type,
-                        f"{detail}_범위마킹_{cell.coordinate}"
+
+            # 1D 범위도 2D와 동일하게 순회하도록 정규화
+            if cell_range and not isinstance(cell_range[0], tuple):
+                cell_range = (cell_range,)
+
+            timestamp = datetime.now().isoformat()
+
+            for row in cell_range:
+                for cell in row:
+                    coordinate = cell.coordinate
+                    original_value = cell.value
+                    cell_detail = f"{detail}_범위마킹_{coordinate}"
+
+                    # 노란색 마킹 적용 (공유 스타일 인스턴스 재사용)
+                    cell.fill = self.yellow_fill
+                    cell.font = self.marked_font
+                    cell.alignment = self.center_alignment
+
+                    # 값 비우기 (CLAUDE.md 규칙: 추정값 절대 금지)
+                    cell.value = None
+                    cell.comment = Comment(
+                        f"데이터 이슈: {issue_type}\n상세: {cell_detail}\n확인 필요",
+                        self._SYSTEM_COMMENT_AUTHOR
                     )
-                    marked_results.append(result)
-            
+
+                    self.marked_cells.append({
+                        'timestamp': timestamp,
+                        'sheet_name': sheet_name,
+                        'cell_coordinate': coordinate,
+                        'account_code': account_code,
+                        'issue_type': issue_type,
+                        'detail': cell_detail,
+                        'original_value': original_value,
+                        'action': '노란색_마킹_값_비움'
+                    })
+
+                    marked_results.append({
+                        'marked': True,
+                        'cell_coordinate': coordinate,
+                        'original_value': original_value,
+                        'issue_type': issue_type,
+                        'detail': cell_detail
+                    })
+
             logging.info(
                 f"[범위마킹완료] [계정_{account_code}] [시트_{sheet_name}] "
                 f"[범위_{start_cell}:{end_cell}] [셀수_{len(marked_results)}개]"
             )
-            
+
         except Exception as e:
             logging.error(
                 f"[범위마킹오류] [계정_{account_code}] [시트_{sheet_name}] "
                 f"[범위_{start_cell}:{end_cell}] [오류_{str(e)}]"
             )
-        
+
         return marked_results
-    
-    def mark_contamination_alert(self, workbook, sheet_name: str, 
+
+    @contextmanager
+    def batched(self, workbook):
+        """마킹 지연 모드 컨텍스트
+
+        블록 내부의 mark_uncertain_cell 호출은 큐에 적재만 하고,
+        블록 종료 시 flush_marks가 시트별로 묶어 일괄 적용한다.
+        (셀마다 시트 재조회·타임스탬프 생성·개별 로깅을 반복하지 않기 위함)
+        """
+        self._deferred = True
+        try:
+            yield self
+        finally:
+            self._deferred = False
+            self.flush_marks(workbook)
+
+    def flush_marks(self, workbook) -> int:
+        """큐에 적재된 마킹을 시트별로 묶어 적용하고 적용 건수 반환"""
+        if not self._mark_queue:
+            return 0
+
+        # 시트별 그룹화 (시트 조회는 그룹당 1회)
+        by_sheet = {}
+        while self._mark_queue:
+            item = self._mark_queue.popleft()
+            by_sheet.setdefault(item[0], []).append(item)
+
+        timestamp = datetime.now().isoformat()
+        flushed = 0
+
+        for sheet_name, items in by_sheet.items():
+            try:
+                sheet = workbook[sheet_name]
+            except KeyError:
+                logging.error("[지연마킹오류] [시트없음_%s] [건수_%s건]", sheet_name, len(items))
+                continue
+
+            for _, cell_coordinate, account_code, issue_type, detail, original_value in items:
+                try:
+                    cell = sheet[cell_coordinate]
+
+                    # 원본 값 보존
+                    if original_value is None:
+                        original_value = cell.value
+
+                    # 노란색 마킹 적용 (공유 스타일 인스턴스 재사용)
+                    cell.fill = self.yellow_fill
+                    cell.font = self.marked_font
+                    cell.alignment = self.center_alignment
+
+                    # 값 비우기 (CLAUDE.md 규칙: 추정값 절대 금지)
+                    cell.value = None
+                    cell.comment = Comment(
+                        f"데이터 이슈: {issue_type}\n상세: {detail}\n확인 필요",
+                        self._SYSTEM_COMMENT_AUTHOR
+                    )
+
+                    self.marked_cells.append({
+                        'timestamp': timestamp,
+                        'sheet_name': sheet_name,
+                        'cell_coordinate': cell_coordinate,
+                        'account_code': account_code,
+                        'issue_type': issue_type,
+                        'detail': detail,
+                        'original_value': original_value,
+                        'action': '노란색_마킹_값_비움'
+                    })
+                    flushed += 1
+
+                except Exception as e:
+                    logging.error(
+                        "[지연마킹오류] [계정_%s] [시트_%s] [셀_%s] [오류_%s]",
+                        account_code, sheet_name, cell_coordinate, str(e)
+                    )
+
+        logging.info("[지연마킹적용] [시트_%s개] [셀_%s개]", len(by_sheet), flushed)
+        return flushed
+
+    def mark_contamination_alert(self, workbook, sheet_name: str,
                                contamination_data: Dict) -> Dict:
         """교차 오염 감지시 마킹"""
         account = contamination_data.get('account', 'UNKNOWN')
@@ -180,22 +380,19 @@ class YellowMarkingSystem:
             # 첫 번째 행에 경고 메시지 추가
             warning_cell = sheet['A1']
             warning_cell.value = f"⚠️ 교차오염위험: {suspicion}"
-            warning_cell.fill = PatternFill(
-                start_color="FF0000",  # 빨간색
-                end_color="FF0000",
-                fill_type="solid"
-            )
-            warning_cell.font = Font(bold=True, color="FFFFFF")
+            warning_cell.fill = self._RED_FILL
+            warning_cell.font = self._WHITE_BOLD_FONT
             
-            # 관련 데이터 영역 노란색 마킹
+            # 관련 데이터 영역 노란색 마킹 (지연 큐로 일괄 적용)
             if month != 'UNKNOWN':
-                # 월별 데이터 추정 위치 마킹
-                for row in range(1, min(sheet.max_row + 1, 100)):
-                    self.mark_uncertain_cell(
-                        workbook, sheet_name, f'G{row}',
-                        account, "교차오염위험",
-                        f"년_{year}_월_{month}_{suspicion}"
-                    )
+                detail = f"년_{year}_월_{month}_{suspicion}"
+                with self.batched(workbook):
+                    # 월별 데이터 추정 위치 마킹
+                    for row in range(1, min(sheet.max_row + 1, 100)):
+                        self.mark_uncertain_cell(
+                            workbook, sheet_name, f'G{row}',
+                            account, "교차오염위험", detail
+                        )
             
             logging.error(
                 f"[교차오염마킹] [계정_{account}] [시트_{sheet_name}] "
@@ -216,28 +413,26 @@ class YellowMarkingSystem:
             )
             return {'contamination_marked': False, 'error': str(e)}
     
-    def _update_stats(self, sheet_name: str, account_code: str, issue_type: str):
-        """마킹 통계 업데이트"""
-        self.marking_stats['total_marked'] += 1
-        
-        # 이슈 유형별 통계
-        if issue_type in self.marking_stats['by_issue_type']:
-            self.marking_stats['by_issue_type'][issue_type] += 1
-        else:
-            self.marking_stats['by_issue_type'][issue_type] = 1
-        
-        # 계정별 통계
-        if account_code in self.marking_stats['by_account']:
-            self.marking_stats['by_account'][account_code] += 1
-        else:
-            self.marking_stats['by_account'][account_code] = 1
-        
-        # 시트별 통계
-        if sheet_name in self.marking_stats['by_sheet']:
-            self.marking_stats['by_sheet'][sheet_name] += 1
-        else:
-            self.marking_stats['by_sheet'][sheet_name] = 1
-    
+    @property
+    def marking_stats(self) -> Dict:
+        """마킹 통계 (요청 시점에 지연 계산, 레코드 수 기준 캐시)
+
+        마킹마다 4개 카운터를 즉시 갱신하는 대신 실제로 통계를 조회할 때
+        Counter 단일 패스로 집계한다. 레코드는 추가만 되므로
+        marked_cells 길이가 그대로면 캐시를 재사용한다.
+        """
+        current_count = len(self.marked_cells)
+        if self._stats_cache is None or self._stats_cached_count != current_count:
+            self._stats_cache = {
+                'total_marked': current_count,
+                'by_issue_type': dict(Counter(r['issue_type'] for r in self.marked_cells)),
+                'by_account': dict(Counter(r['account_code'] for r in self.marked_cells)),
+                'by_sheet': dict(Counter(r['sheet_name'] for r in self.marked_cells))
+            }
+            self._stats_cached_count = current_count
+        return self._stats_cache
+
+
     def create_marking_summary_sheet(self, workbook) -> Dict:
         """마킹 요약 시트 생성"""
         try:
@@ -257,38 +452,32 @@ class YellowMarkingSystem:
             for col, header in enumerate(headers, 1):
                 cell = summary_sheet.cell(row=1, column=col)
                 cell.value = header
-                cell.fill = PatternFill(
-                    start_color="CCCCCC",
-                    end_color="CCCCCC",
-                    fill_type="solid"
-                )
-                cell.font = Font(bold=True)
-            
-            # 데이터 작성
-            for idx, record in enumerate(self.marked_cells, 2):
-                summary_sheet.cell(row=idx, column=1).value = idx - 1
-                summary_sheet.cell(row=idx, column=2).value = record['sheet_name']
-                summary_sheet.cell(row=idx, column=3).value = record['cell_coordinate']
-                summary_sheet.cell(row=idx, column=4).value = record['account_code']
-                summary_sheet.cell(row=idx, column=5).value = record['issue_type']
-                summary_sheet.cell(row=idx, column=6).value = record['detail']
-                summary_sheet.cell(row=idx, column=7).value = record['original_value']
-                summary_sheet.cell(row=idx, column=8).value = record['timestamp']
-                summary_sheet.cell(row=idx, column=9).value = "확인필요"
-                
+                cell.fill = self._GRAY_FILL
+                cell.font = self._HEADER_BOLD_FONT
+            
+            # 데이터 작성 (행 단위 append로 셀별 좌표 재계산 제거)
+            for number, record in enumerate(self.marked_cells, 1):
+                summary_sheet.append([
+                    number,
+                    record['sheet_name'],
+                    record['cell_coordinate'],
+                    record['account_code'],
+                    record['issue_type'],
+                    record['detail'],
+                    record['original_value'],
+                    record['timestamp'],
+                    "확인필요"
+                ])
+
                 # 행 색상 (연한 노란색)
-                for col in range(1, 10):
-                    summary_sheet.cell(row=idx, column=col).fill = PatternFill(
-                        start_color="FFFACD",
-                        end_color="FFFACD",
-                        fill_type="solid"
-                    )
+                for cell in summary_sheet[summary_sheet.max_row]:
+                    cell.fill = self._LIGHT_YELLOW_FILL
             
             # 통계 섹션 추가
             stats_row = len(self.marked_cells) + 5
             
             summary_sheet.cell(row=stats_row, column=1).value = "=== 마킹 통계 ==="
-            summary_sheet.cell(row=stats_row, column=1).font = Font(bold=True, size=14)
+            summary_sheet.cell(row=stats_row, column=1).font = self._STATS_TITLE_FONT
             
             summary_sheet.cell(row=stats_row + 1, column=1).value = "총 마킹 개수:"
             summary_sheet.cell(row=stats_row + 1, column=2).value = self.marking_stats['total_marked']
@@ -320,25 +509,36 @@ class YellowMarkingSystem:
             logging.error(f"[마킹요약시트오류] [오류_{str(e)}]")
             return {'summary_created': False, 'error': str(e)}
     
-    def get_marking_summary(self) -> Dict:
-        """마킹 결과 요약 반환"""
-        return {
+    def get_marking_summary(self, include_details: bool = False) -> Dict:
+        """마킹 결과 요약 반환
+
+        include_details=True일 때만 마킹 레코드 전체를 포함
+        (대량 마킹 시 요약 조회마다 전체 리스트를 복사/직렬화하는 비용 방지)
+        """
+        summary = {
             'timestamp': datetime.now().isoformat(),
             'total_marked_cells': len(self.marked_cells),
             'marking_statistics': self.marking_stats,
-            'marked_cells_details': self.marked_cells,
             'data_integrity_status': 'COMPROMISED' if self.marked_cells else 'INTACT'
         }
+        if include_details:
+            summary['marked_cells_details'] = self.marked_cells
+        return summary
+
+    def iter_marked_cells(self):
+        """마킹 레코드 순회 제너레이터 (전체 리스트 복사 없이 건별 처리용)"""
+        yield from self.marked_cells
     
     def export_marking_log(self, file_path: str = None) -> str:
         """마킹 로그를 별도 파일로 내보내기"""
+        now = datetime.now()
         if not file_path:
-            file_path = f"./log/marking_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
-        
+            file_path = f"./log/marking_log_{now.strftime('%Y%m%d_%H%M%S')}.txt"
+
         try:
             with open(file_path, 'w', encoding='utf-8') as f:
                 f.write("=== 노란색 마킹 상세 로그 ===\n")
-                f.write(f"생성일시: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+                f.write(f"생성일시: {now.strftime('%Y-%m-%d %H:%M:%S')}\n")
                 f.write(f"총 마킹 개수: {len(self.marked_cells)}건\n\n")
                 
                 f.write("=== 마킹 통계 ===\n")
@@ -381,11 +581,12 @@ class YellowMarkingSystem:
             'recommendations': []
         }
         
-        # 중복 마킹 검사
-        cell_coordinates = [record['cell_coordinate'] + '_' + record['sheet_name'] 
-                           for record in self.marked_cells]
-        duplicates = [coord for coord in set(cell_coordinates) 
-                     if cell_coordinates.count(coord) > 1]
+        # 중복 마킹 검사 (Counter 단일 패스, 좌표별 리스트 재스캔 제거)
+        coordinate_counts = Counter(
+            (record['cell_coordinate'], record['sheet_name'])
+            for record in self.marked_cells
+        )
+        duplicates = [key for key, count in coordinate_counts.items() if count > 1]
         
         if duplicates:
             validation_result['integrity_check_passed'] = False
@@ -420,69 +621,52 @@ class YellowMarkingSystem:
     
     def detect_cross_contamination(self, v3_data: Dict, ledger_data: Dict) -> List[Dict]:
         """교차 오염 실시간 감지 시스템 (CLAUDE.md 17. 규칙)"""
-        contamination_alerts = []
-        
         logging.info("[교차오염감지시작] [v3데이터_vs_원장데이터_비교]")
-        
-        for account_code in v3_data.keys():
-            for year, year_data in v3_data[account_code].items():
-                for month, v3_value in year_data.items():
-                    ledger_value = ledger_data.get(year, {}).get(account_code, {}).get(month, 0)
-                    
-                    # 패턴 1: v3에 외부 데이터 유입 의심
-                    if v3_value != 0 and ledger_value == 0:
-                        alert = {
-                            'account': account_code,
-                            'year': year,
-                            'month': month,
-                            'v3_value': v3_value,
-                            'ledger_value': ledger_value,
-                            'suspicion': 'v3에_외부데이터_유입_의심',
-                            'contamination_type': 'EXTERNAL_DATA_INJECTION',
-                            'risk_level': 'HIGH'
-                        }
-                        contamination_alerts.append(alert)
-                        logging.error(
-                            f"[교차오염감지] [유형_외부데이터유입] [계정_{account_code}] "
-                            f"[년_{year}] [월_{month}] [v3값_{v3_value}] [원장값_{ledger_value}]"
-                        )
-                    
-                    # 패턴 2: 부호 반전 오류 감지
-                    elif v3_value * ledger_value < 0 and abs(v3_value) == abs(ledger_value):
-                        alert = {
-                            'account': account_code,
-                            'year': year,
-                            'month': month,
-                            'v3_value': v3_value,
-                            'ledger_value': ledger_value,
-                            'suspicion': '부호반전_처리오류',
-                            'contamination_type': 'SIGN_REVERSAL_ERROR',
-                            'risk_level': 'MEDIUM'
-                        }
-                        contamination_alerts.append(alert)
-                        logging.warning(
-                            f"[교차오염감지] [유형_부호반전] [계정_{account_code}] "
-                            f"[년_{year}] [월_{month}] [v3값_{v3_value}] [원장값_{ledger_value}]"
-                        )
-                    
-                    # 패턴 3: 수익 계정 음수값 감지
-                    elif self._is_revenue_account(account_code) and v3_value < 0:
-                        alert = {
-                            'account': account_code,
-                            'year': year,
-                            'month': month,
-                            'v3_value': v3_value,
-                            'ledger_value': ledger_value,
-                            'suspicion': '수익계정_음수값_오염',
-                            'contamination_type': 'REVENUE_NEGATIVE_VALUE',
-                            'risk_level': 'HIGH'
-                        }
-                        contamination_alerts.append(alert)
-                        logging.error(
-                            f"[교차오염감지] [유형_수익계정음수] [계정_{account_code}] "
-                            f"[년_{year}] [월_{month}] [v3값_{v3_value}] [수익계정_음수불가]"
-                        )
-        
+
+        items = list(v3_data.items())
+        worker_count = min(os.cpu_count() or 1, 4)
+
+        if len(items) >= self._PARALLEL_SCAN_THRESHOLD and worker_count > 1:
+            # 계정 묶음을 워커 수만큼 분할하여 병렬 검사
+            chunk_size = -(-len(items) // worker_count)
+            chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+            contamination_alerts = []
+            with ProcessPoolExecutor(max_workers=worker_count) as pool:
+                for chunk_alerts in pool.map(
+                    _scan_contamination_chunk, chunks,
+                    [ledger_data] * len(chunks), [self._revenue_codes] * len(chunks)
+                ):
+                    contamination_alerts.extend(chunk_alerts)
+        else:
+            contamination_alerts = _scan_contamination_chunk(
+                items, ledger_data, self._revenue_codes
+            )
+
+        # 알람별 로그는 부모 프로세스에서 기록 (워커는 로깅하지 않음)
+        for alert in contamination_alerts:
+            contamination_type = alert['contamination_type']
+            if contamination_type == 'EXTERNAL_DATA_INJECTION':
+                logging.error(
+                    "[교차오염감지] [유형_외부데이터유입] [계정_%s] "
+                    "[년_%s] [월_%s] [v3값_%s] [원장값_%s]",
+                    alert['account'], alert['year'], alert['month'],
+                    alert['v3_value'], alert['ledger_value']
+                )
+            elif contamination_type == 'SIGN_REVERSAL_ERROR':
+                logging.warning(
+                    "[교차오염감지] [유형_부호반전] [계정_%s] "
+                    "[년_%s] [월_%s] [v3값_%s] [원장값_%s]",
+                    alert['account'], alert['year'], alert['month'],
+                    alert['v3_value'], alert['ledger_value']
+                )
+            elif contamination_type == 'REVENUE_NEGATIVE_VALUE':
+                logging.error(
+                    "[교차오염감지] [유형_수익계정음수] [계정_%s] "
+                    "[년_%s] [월_%s] [v3값_%s] [수익계정_음수불가]",
+                    alert['account'], alert['year'], alert['month'], alert['v3_value']
+                )
+
+
         # 패턴 4: 동일 금액 여러 계정 중복 감지
         duplicate_amounts = self._detect_duplicate_amounts(v3_data)
         for duplicate_info in duplicate_amounts:
@@ -513,40 +697,25 @@ class YellowMarkingSystem:
         return contamination_alerts
     
     def _is_revenue_account(self, account_code: str) -> bool:
-        """수익 계정 여부 판단"""
-        try:
-            code_num = int(account_code)
-            # 수익 계정 범위: 40000-42100, 90000-92100
-            revenue_ranges = [(40000, 42100), (90000, 92100)]
-            return any(start <= code_num <= end for start, end in revenue_ranges)
-        except (ValueError, TypeError):
-            return False
+        """수익 계정 여부 판단 (사전 계산된 집합 멤버십 조회)"""
+        return str(account_code) in self._revenue_codes
     
     def _detect_duplicate_amounts(self, v3_data: Dict) -> List[Dict]:
-        """동일 금액 중복 감지"""
-        duplicate_amounts = []
-        amount_map = {}  # {(year, month, value): [account_codes]}
-        
+        """동일 금액 중복 감지 (단일 패스 그룹화)"""
+        amount_map = defaultdict(list)  # {(year, month, value): [account_codes]}
+
         for account_code, account_data in v3_data.items():
             for year, year_data in account_data.items():
                 for month, value in year_data.items():
                     if value != 0:  # 0값은 제외
-                        key = (year, month, value)
-                        if key not in amount_map:
-                            amount_map[key] = []
-                        amount_map[key].append(account_code)
-        
+                        amount_map[(year, month, value)].append(account_code)
+
         # 중복 발견
-        for (year, month, value), accounts in amount_map.items():
-            if len(accounts) > 1:
-                duplicate_amounts.append({
-                    'year': year,
-                    'month': month,
-                    'value': value,
-                    'accounts': accounts
-                })
-        
-        return duplicate_amounts
+        return [
+            {'year': year, 'month': month, 'value': value, 'accounts': accounts}
+            for (year, month, value), accounts in amount_map.items()
+            if len(accounts) > 1
+        ]
     
     def mark_all_contamination_alerts(self, workbook, contamination_alerts: List[Dict]) -> Dict:
         """모든 교차 오염 알람을 시각적으로 마킹"""
@@ -594,8 +763,8 @@ class YellowMarkingSystem:
         """교차 오염 경고 시트 생성"""
         # 헤더
         sheet['A1'] = "⚠️ 교차 오염 감지 알람"
-        sheet['A1'].fill = PatternFill(start_color="FF0000", end_color="FF0000", fill_type="solid")
-        sheet['A1'].font = Font(bold=True, color="FFFFFF", size=14)
+        sheet['A1'].fill = self._RED_FILL
+        sheet['A1'].font = self._WHITE_BOLD_TITLE_FONT
         
         # 상세 정보
         sheet['A3'] = "계정 코드:"
@@ -615,15 +784,15 @@ class YellowMarkingSystem:
         
         # 경고 색상 적용
         for row in range(3, 10):
-            sheet[f'A{row}'].fill = PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type="solid")
-            sheet[f'B{row}'].fill = PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type="solid")
+            sheet[f'A{row}'].fill = self.yellow_fill
+            sheet[f'B{row}'].fill = self.yellow_fill
     
     def _create_duplicate_warning_sheet(self, sheet, alert: Dict):
         """중복 금액 경고 시트 생성"""
         # 헤더
         sheet['A1'] = "⚠️ 중복 금액 교차 오염 감지"
-        sheet['A1'].fill = PatternFill(start_color="FF0000", end_color="FF0000", fill_type="solid")
-        sheet['A1'].font = Font(bold=True, color="FFFFFF", size=14)
+        sheet['A1'].fill = self._RED_FILL
+        sheet['A1'].font = self._WHITE_BOLD_TITLE_FONT
         
         # 상세 정보
         sheet['A3'] = "관련 계정들:"
@@ -639,13 +808,30 @@ class YellowMarkingSystem:
         
         # 경고 색상 적용
         for row in range(3, 8):
-            sheet[f'A{row}'].fill = PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type="solid")
-            sheet[f'B{row}'].fill = PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type="solid")
+            sheet[f'A{row}'].fill = self.yellow_fill
+            sheet[f'B{row}'].fill = self.yellow_fill
     
-    def real_time_contamination_monitor(self, account_code: str, new_data: Dict, 
-                                      existing_data: Dict) -> bool:
+    @staticmethod
+    def _build_month_value_index(existing_data: Dict) -> Dict:
+        """(월, 값) -> [계정코드] 역색인 생성
+
+        실시간 모니터링의 중복 금액 검사를 전 계정 순회 대신
+        O(1) 멤버십 조회로 바꾸기 위한 사전 색인. 같은 existing_data로
+        여러 계정을 연속 검사할 때는 호출측에서 한 번 만들어
+        existing_index로 전달해 재사용한다.
+        """
+        index = defaultdict(list)
+        for existing_account, existing_months in existing_data.items():
+            for month, value in existing_months.items():
+                if value != 0:
+                    index[(month, value)].append(existing_account)
+        return index
+
+    def real_time_contamination_monitor(self, account_code: str, new_data: Dict,
+                                      existing_data: Dict,
+                                      existing_index: Optional[Dict] = None) -> bool:
         """실시간 교차 오염 모니터링 (데이터 쓰기 전 사전 차단)"""
-        
+
         # 1. 수익 계정 음수값 즉시 차단
         if self._is_revenue_account(account_code):
             for month, value in new_data.items():
@@ -655,19 +841,21 @@ class YellowMarkingSystem:
                         f"[월_{month}] [값_{value}] [처리중단]"
                     )
                     return False
-        
-        # 2. 동일 금액 중복 즉시 감지
+
+        # 2. 동일 금액 중복 즉시 감지 ((월, 값) 역색인 조회)
+        if existing_index is None:
+            existing_index = self._build_month_value_index(existing_data)
+
         for month, new_value in new_data.items():
             if new_value != 0:
-                for existing_account, existing_months in existing_data.items():
-                    if existing_account != account_code and month in existing_months:
-                        if existing_months[month] == new_value:
-                            logging.error(
-                                f"[실시간오염차단] [중복금액] [계정_{account_code}] "
-                                f"[기존계정_{existing_account}] [월_{month}] [값_{new_value}] [처리중단]"
-                            )
-                            return False
-        
+                for existing_account in existing_index.get((month, new_value), ()):
+                    if existing_account != account_code:
+                        logging.error(
+                            f"[실시간오염차단] [중복금액] [계정_{account_code}] "
+                            f"[기존계정_{existing_account}] [월_{month}] [값_{new_value}] [처리중단]"
+                        )
+                        return False
+
         # 3. 원장 없는 계정에 데이터 입력 시도 차단
         if account_code not in existing_data and any(v != 0 for v in new_data.values()):
             logging.warning(
@@ -135,6 +135,83 @@ class MCPInterface:
             
             return error_response
     
+    def analyze_account_patterns_bulk(self, data_list: List[Dict],
+                                      account_type: str) -> List[MCPResponse]:
+        """
+        계정 패턴 분석 일괄 처리
+        여러 배치 데이터를 MCP 호출 1회로 묶어 호출 오버헤드 분산
+        """
+        if not data_list:
+            return []
+
+        start_time = time.time()
+
+        try:
+            # 묶음 전체를 하나의 MCP 요청으로 구성
+            mcp_request = MCPRequest(
+                request_type='account_pattern_analysis',
+                account_data={'bulk_items': data_list},
+                context={
+                    'account_type': account_type,
+                    'bulk_size': len(data_list),
+                    'analysis_goal': '정확도_최우선_패턴_분석'
+                },
+                batch_size=len(data_list),
+                priority='HIGH'
+            )
+
+            response = self._call_mcp_api(mcp_request)
+
+            processing_time = time.time() - start_time
+
+            # 통계 업데이트 (호출 1회 기준)
+            self._update_mcp_stats(response, processing_time)
+
+            self.logger.log_mcp_interaction(
+                'INFO', 'PATTERN_ANALYSIS_BULK',
+                f'계정패턴일괄분석_{account_type}_{len(data_list)}건',
+                f'성공_{response.success}_확신도_{response.confidence_level}',
+                response.token_usage
+            )
+
+            # 항목별 응답으로 분배 (처리 시간은 균등 배분)
+            per_item_time = processing_time / len(data_list)
+            return [
+                MCPResponse(
+                    success=response.success,
+                    analysis_result=response.analysis_result,
+                    confidence_level=response.confidence_level,
+                    uncertain_items=response.uncertain_items,
+                    token_usage=response.token_usage,
+                    processing_time=per_item_time,
+                    error_message=response.error_message
+                )
+                for _ in data_list
+            ]
+
+        except Exception as e:
+            processing_time = time.time() - start_time
+
+            self.logger.log_mcp_interaction(
+                'ERROR', 'PATTERN_ANALYSIS_BULK_ERROR',
+                f'계정패턴일괄분석오류_{account_type}',
+                str(e),
+                {'error': True}
+            )
+
+            return [
+                MCPResponse(
+                    success=False,
+                    analysis_result={},
+                    confidence_level='UNCERTAIN',
+                    uncertain_items=[],
+                    token_usage={'error': True},
+                    processing_time=processing_time / len(data_list),
+                    error_message=str(e)
+                )
+                for _ in data_list
+            ]
+
     def verify_vat_status(self, transaction_data: List[Dict]) -> MCPResponse:
         """
         VAT 포함/제외 판단 (MCP 전용 작업)
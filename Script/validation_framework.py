@@ -68,8 +68,15 @@ class DataValidator:
         logging.info(f"[초기화완료] [로그파일_{self.log_file}] [UTC인코딩보장]")
     
     def _create_utf8_log(self) -> str:
-        """UTF-8 인코딩 보장 로그 파일 생성"""
-        log_filename = f"./log/{datetime.now().strftime('%Y-%m-%d_%H%M%S')}.log"
+        """UTF-8 인코딩 보장 로그 파일 생성
+
+        파일명에 PID를 포함해 같은 초에 초기화되는 워커 프로세스끼리
+        동일 파일을 'w' 모드로 재열어 서로의 감사 기록을 지우는 것을 방지
+        (노란색 마킹과 로그 엔트리의 1:1 대응 규칙 보호)
+        """
+        log_filename = (
+            f"./log/{datetime.now().strftime('%Y-%m-%d_%H%M%S')}_p{os.getpid()}.log"
+        )
         os.makedirs("./log", exist_ok=True)
         
         # UTF-8 인코딩 명시적 지정
@@ -405,6 +412,180 @@ class DataValidator:
             result['issues'].append(f"검증오류_{str(e)}")
             return result
     
+    def _record_yellow_mark(self, coordinate: str, account_code: str, issue: str,
+                            detail: str, original_value: Any = None):
+        """값 기반 검증 경로용 마킹 기록 (실제 셀 기록은 편집용 워크북에서 수행)"""
+        self.yellow_marks.append({
+            'cell': coordinate,
+            'account': account_code,
+            'issue': issue,
+            'detail': detail,
+            'original_value': original_value
+        })
+
+        logging.warning(f"[{account_code}] [{issue}] [{detail}] [셀_{coordinate}_노란색마킹대상] [원본값_{original_value}]")
+
+    def validate_account_rows(self, sheet_name: str, rows: List[tuple]) -> Dict:
+        """
+        계정별 종합 검증 (값 행렬 기반)
+        rows: iter_rows(values_only=True)로 추출한 시트 전체 값 (1행부터)
+        워크북 객체 없이 동작하므로 병렬 워커 프로세스에서 사용 가능
+        """
+        result = {
+            'account_code': None,
+            'account_type': None,
+            'carry_forward': None,
+            'monthly_data': {},
+            'validation_passed': False,
+            'issues': []
+        }
+
+        try:
+            # 계정 코드 추출
+            account_code = self.extract_account_code(sheet_name)
+            if not account_code:
+                result['issues'].append("계정코드_추출_실패")
+                return result
+
+            result['account_code'] = account_code
+
+            # 계정 유형 분류
+            account_type = self.classify_account_type(account_code)
+            if account_type == "UNKNOWN":
+                result['issues'].append("계정분류_실패")
+
+            result['account_type'] = account_type
+
+            # 데이터 구조 검증 (1행 A~G열 필수)
+            header = rows[0] if rows else ()
+            structure_ok = True
+            for col_idx in range(7):
+                value = header[col_idx] if col_idx < len(header) else None
+                if not value:
+                    structure_ok = False
+                    self._record_yellow_mark(
+                        f"{chr(ord('A') + col_idx)}1", sheet_name,
+                        "구조오류", f"필수컬럼_{chr(ord('A') + col_idx)}_누락"
+                    )
+            if not structure_ok:
+                result['issues'].append("데이터구조_검증실패")
+                return result
+
+            # 전기이월 검증 (5행: B=전기이월, G=금액)
+            carry_forward = self._validate_carry_forward_values(rows, account_code)
+            result['carry_forward'] = carry_forward
+            if carry_forward is None:
+                result['issues'].append("전기이월_검증실패")
+
+            # 월별 데이터 추출
+            monthly_data = self._extract_monthly_data_from_rows(rows, account_code, account_type)
+            result['monthly_data'] = monthly_data
+
+            # 검증 완료 판정
+            if not result['issues']:
+                result['validation_passed'] = True
+                logging.info(f"[계정검증완료] [코드_{account_code}] [유형_{account_type}] [성공]")
+            else:
+                logging.warning(f"[계정검증부분실패] [코드_{account_code}] [이슈_{result['issues']}]")
+
+            return result
+
+        except Exception as e:
+            logging.error(f"[계정검증오류] [시트_{sheet_name}] [오류_{str(e)}]")
+            result['issues'].append(f"검증오류_{str(e)}")
+            return result
+
+    def _validate_carry_forward_values(self, rows: List[tuple], account_code: str) -> Optional[float]:
+        """전기이월 검증 (값 행렬 기반, validate_carry_forward와 동일 규칙)"""
+        row5 = rows[4] if len(rows) >= 5 else ()
+        b5_value = row5[1] if len(row5) > 1 else None
+        g5_value = row5[6] if len(row5) > 6 else None
+
+        if b5_value != "전기이월":
+            logging.warning(f"[전기이월검증실패] [계정_{account_code}] [B5값_{b5_value}] [전기이월아님] [노란색마킹]")
+            self._record_yellow_mark('G5', account_code, "전기이월불확실",
+                                     f"B5값이_전기이월이_아님_{b5_value}", g5_value)
+            return None
+
+        if isinstance(g5_value, (int, float)):
+            logging.info(f"[전기이월검증성공] [계정_{account_code}] [금액_{g5_value:,}원]")
+            return float(g5_value)
+        elif g5_value is None or g5_value == "":
+            logging.info(f"[전기이월없음] [계정_{account_code}] [G5빈값] [0원처리]")
+            return 0.0
+        else:
+            logging.warning(f"[전기이월형식오류] [계정_{account_code}] [G5값_{g5_value}] [숫자아님] [노란색마킹]")
+            self._record_yellow_mark('G5', account_code, "전기이월형식오류",
+                                     f"G5값이_숫자가_아님_{g5_value}", g5_value)
+            return None
+
+    def _extract_monthly_data_from_rows(self, rows: List[tuple], account_code: str,
+                                        account_type: str) -> Dict[str, float]:
+        """월별 데이터 추출 (값 행렬 기반, extract_monthly_data와 동일 규칙)"""
+        monthly_data = {}
+
+        try:
+            date_pattern = r'(\d{2})-\d{2}'  # MM-DD 패턴
+            current_month = None
+            monthly_transactions = {}
+
+            for row_idx in range(5, len(rows)):  # 6행부터 데이터 시작
+                row = rows[row_idx]
+                date_value = row[0] if len(row) > 0 else None
+
+                if date_value and isinstance(date_value, str):
+                    match = re.search(date_pattern, date_value)
+                    if match:
+                        month = match.group(1)
+
+                        if current_month != month:
+                            current_month = month
+                            monthly_transactions[month] = []
+
+                        debit = self._safe_float_conversion(
+                            row[4] if len(row) > 4 else None, f"차변_M{month}")
+                        credit = self._safe_float_conversion(
+                            row[5] if len(row) > 5 else None, f"대변_M{month}")
+                        balance = self._safe_float_conversion(
+                            row[6] if len(row) > 6 else None, f"잔액_M{month}")
+
+                        if current_month:
+                            monthly_transactions[current_month].append({
+                                'debit': debit,
+                                'credit': credit,
+                                'balance': balance,
+                                'row': row_idx + 1
+                            })
+
+            # BS/PL에 따른 데이터 처리
+            for month, transactions in monthly_transactions.items():
+                if account_type == "BS":
+                    if transactions:
+                        final_balance = transactions[-1]['balance']
+                        if final_balance is not None:
+                            monthly_data[month] = final_balance
+                            logging.info(f"[BS월별데이터] [계정_{account_code}] [M{month}] [잔액_{final_balance:,}원]")
+                        else:
+                            logging.warning(f"[BS잔액누락] [계정_{account_code}] [M{month}] [노란색마킹]")
+
+                elif account_type == "PL":
+                    month_total = 0
+                    for trans in transactions:
+                        if trans['debit'] is not None and trans['credit'] is not None:
+                            month_total += (trans['debit'] - trans['credit'])
+
+                    monthly_data[month] = month_total
+                    logging.info(f"[PL월별데이터] [계정_{account_code}] [M{month}] [순증감_{month_total:,}원]")
+
+                else:  # UNKNOWN 계정
+                    logging.warning(f"[계정유형불명] [계정_{account_code}] [M{month}] [처리제외] [노란색마킹]")
+
+            return monthly_data
+
+        except Exception as e:
+            logging.error(f"[월별데이터추출오류] [계정_{account_code}] [오류_{str(e)}]")
+            return {}
+
     def get_validation_summary(self) -> Dict:
         """검증 결과 요약"""
         return {